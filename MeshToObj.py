@@ -6,8 +6,12 @@ Converts Ogre .mesh files to OBJ format via XML intermediate
 
 import os
 import sys
+import shutil
 import subprocess
 import xml.etree.ElementTree as ET
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from contextlib import nullcontext, redirect_stdout
+from io import StringIO
 from pathlib import Path
 import argparse
 
@@ -41,21 +45,27 @@ class OgreXMLConverter:
                 if path.exists():
                     return str(path)
         
-        # Try system PATH
+        # Try system PATH without spawning 'where'/'which'
         for name in possible_names:
-            try:
-                # On Windows, 'where' is used; on Unix, 'which'
-                cmd = ['where' if os.name == 'nt' else 'which', name]
-                result = subprocess.run(cmd, capture_output=True, text=True, creationflags=CREATE_NO_WINDOW)
-                if result.returncode == 0:
-                    return result.stdout.strip().splitlines()[0]
-            except Exception:
-                pass
+            found = shutil.which(name)
+            if found:
+                return found
         
         return 'OgreXMLConverter'  # Hope it's in PATH
     
     def convert_to_xml(self, input_file, output_dir=None):
         """Convert a single .mesh or .skeleton file to XML"""
+        xml_file, messages = self._convert_to_xml(input_file, output_dir)
+        print("\n".join(messages))
+        return xml_file
+    
+    def _convert_to_xml(self, input_file, output_dir=None):
+        """convert_to_xml() without printing: returns (xml_file or None, messages).
+        
+        Safe to run on worker threads; the caller prints the messages, so lines
+        from parallel conversions never interleave.
+        """
+        messages = []
         input_path = Path(input_file)
         
         if output_dir:
@@ -73,56 +83,74 @@ class OgreXMLConverter:
                 # Add output directory parameter
                 cmd = [self.converter, str(input_path), '-d', str(output_dir)]
             
-            print(f"Running: {' '.join(cmd)}")
+            messages.append(f"Running: {' '.join(cmd)}")
             # Don't use check=True because OgreXMLConverter returns non-zero for skeleton warnings
             result = subprocess.run(cmd, capture_output=True, text=True, creationflags=CREATE_NO_WINDOW)
             
             # Check if file was actually created regardless of return code
             if Path(xml_output).exists():
-                print(f"✓ Converted {input_path.name} to XML")
-                return xml_output
+                messages.append(f"✓ Converted {input_path.name} to XML")
+                return xml_output, messages
             
             # Try alternative naming
             alt_xml = str(output_path.with_suffix('')) + '.xml'
             if Path(alt_xml).exists():
-                print(f"✓ Converted {input_path.name} to XML")
-                return alt_xml
+                messages.append(f"✓ Converted {input_path.name} to XML")
+                return alt_xml, messages
 
             if result.returncode != 0:
-                print(f"✗ Failed to convert {input_path.name}")
-                print(f"  stdout: {result.stdout}")
-                print(f"  stderr: {result.stderr}")
+                messages.append(f"✗ Failed to convert {input_path.name}")
+                messages.append(f"  stdout: {result.stdout}")
+                messages.append(f"  stderr: {result.stderr}")
             else:
-                print(f"  Warning: Expected XML file not found at {xml_output}")
-            return None
+                messages.append(f"  Warning: Expected XML file not found at {xml_output}")
+            return None, messages
                 
-        except FileNotFoundError:
-            print(f"✗ OgreXMLConverter not found at: {self.converter}")
-            print(f"  Please specify path with --ogre-tools")
-            return None
-        except Exception as e:
-            print(f"✗ Error during XML conversion of {input_path.name}: {e}")
-            return None
+        except FileNotFoundError:
+            messages.append(f"✗ OgreXMLConverter not found at: {self.converter}")
+            messages.append(f"  Please specify path with --ogre-tools")
+            return None, messages
+        except Exception as e:
+            messages.append(f"✗ Error during XML conversion of {input_path.name}: {e}")
+            return None, messages
     
-    def batch_convert(self, input_dir, output_dir=None, extensions=(".mesh",)):
-        """Convert all Ogre files in a directory"""
+    def batch_convert(self, input_dir, output_dir=None, extensions=(".mesh",), max_workers=None,
+                      cancel_event=None):
+        """Convert all Ogre files in a directory
+        
+        Once cancel_event (a threading.Event) is set, jobs that have not
+        started are dropped and the XMLs converted so far are returned.
+        """
         input_path = Path(input_dir)
-        converted_files = []
-        
-        if output_dir:
-            Path(output_dir).mkdir(parents=True, exist_ok=True)
-        
+        
+        if output_dir:
+            Path(output_dir).mkdir(parents=True, exist_ok=True)
+        
+        jobs = []
         for ext in extensions:
             for file in input_path.rglob(f'*{ext}'):
                 xml_output_dir = None
                 if output_dir:
                     rel_parent = file.parent.relative_to(input_path)
                     xml_output_dir = Path(output_dir) / rel_parent
-                xml_file = self.convert_to_xml(file, xml_output_dir)
+                jobs.append((file, xml_output_dir))
+        
+        # Each conversion is its own OgreXMLConverter process, so threads are
+        # enough to keep several of them running at once. Output is printed
+        # here, one job at a time and in job order.
+        xml_files = []
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(self._convert_to_xml, *job) for job in jobs]
+            for future in futures:
+                if cancel_event is not None and cancel_event.is_set():
+                    # Conversions already running finish; queued ones never start
+                    executor.shutdown(wait=True, cancel_futures=True)
+                    break
+                xml_file, messages = future.result()
+                print("\n".join(messages))
                 if xml_file:
-                    converted_files.append(xml_file)
-        
-        return converted_files
+                    xml_files.append(xml_file)
+        return xml_files
 
 
 class OgreXMLToOBJ:
@@ -418,6 +446,51 @@ class OgreXMLToOBJ:
         print(f"✓ Converted {Path(xml_file).name} to {Path(obj_file).name}")
 
 
+def _convert_obj_job(job, capture=True):
+    """Worker for convert_obj_jobs(); returns (xml_file, captured_output, error).
+    
+    Only pool workers capture: in-process, redirect_stdout would swap the
+    process-wide sys.stdout under every other thread too.
+    """
+    xml_file, obj_file, create_mtl, texture_search_roots = job
+    log = StringIO()
+    error = None
+    try:
+        with redirect_stdout(log) if capture else nullcontext():
+            OgreXMLToOBJ().convert(
+                xml_file,
+                obj_file,
+                create_mtl=create_mtl,
+                texture_search_roots=texture_search_roots,
+            )
+    except Exception as e:
+        error = str(e)
+    return xml_file, log.getvalue(), error
+
+
+def convert_obj_jobs(jobs, max_workers=None):
+    """Convert (xml_file, obj_file, create_mtl, texture_search_roots) jobs to OBJ.
+
+    Jobs are independent, so more than one is fanned out over a process pool
+    of max_workers (ProcessPoolExecutor's default when None). Yields
+    (xml_file, captured_output, error) as each finishes; error is None on
+    success.
+    """
+    if len(jobs) <= 1:
+        for job in jobs:
+            yield _convert_obj_job(job, capture=False)
+        return
+
+    executor = ProcessPoolExecutor(max_workers=max_workers)
+    try:
+        futures = [executor.submit(_convert_obj_job, job) for job in jobs]
+        for future in as_completed(futures):
+            yield future.result()
+    finally:
+        # Closing the generator early drops jobs that have not started yet
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
 def main():
     parser = argparse.ArgumentParser(
         description='Convert Ogre mesh files to OBJ format',
@@ -458,8 +531,6 @@ Examples:
     xml_converter = OgreXMLConverter(args.ogre_tools)
     
     if args.batch:
-        import shutil
-
         output_dir = Path(args.output)
         output_dir.mkdir(parents=True, exist_ok=True)
         
@@ -485,28 +556,25 @@ Examples:
 
         print(f"\n=== Converting XML to OBJ ===")
         print(f"Processing {len(xml_files)} XML files")
-        
+        
+        jobs = []
         for xml_file in xml_files:
             xml_path = Path(xml_file)
-            print(f"Processing: {xml_path.relative_to(xml_dir)}")
-            
             if xml_path.suffix == '.xml':
                 rel_xml = xml_path.relative_to(xml_dir)
                 obj_rel = rel_xml.with_name(obj_output_name(rel_xml.name))
                 obj_file = output_dir / obj_rel
                 obj_file.parent.mkdir(parents=True, exist_ok=True)
-                
-                try:
-                    converter = OgreXMLToOBJ()
-                    converter.convert(
-                        xml_file,
-                        obj_file,
-                        create_mtl=not args.no_mtl,
-                        texture_search_roots=[args.input],
-                    )
-                except Exception as e:
-                    had_errors = True
-                    print(f"✗ Error converting {rel_xml}: {e}")
+                jobs.append((xml_file, obj_file, not args.no_mtl, [args.input]))
+        
+        for xml_file, output, error in convert_obj_jobs(jobs):
+            rel_xml = Path(xml_file).relative_to(xml_dir)
+            print(f"Processing: {rel_xml}")
+            if output.strip():
+                print(output.rstrip())
+            if error:
+                had_errors = True
+                print(f"✗ Error converting {rel_xml}: {error}")
         
         if not args.keep_xml:
             shutil.rmtree(xml_dir)
@@ -137,6 +137,10 @@ def collect_jobs(input_path, output_dir):
 
 
 def main():
+    # Blender's stdout is block-buffered when piped; the GUI streams it per line
+    if hasattr(sys.stdout, "reconfigure"):
+        sys.stdout.reconfigure(line_buffering=True)
+
     argv = sys.argv
     if "--" not in argv:
         print("Usage: blender -b -P batch_ogre_to_gltf.py -- <input_path> <output_dir> <OgreXMLConverter.exe>")
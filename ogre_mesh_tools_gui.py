@@ -1,18 +1,33 @@
+import functools
+import itertools
 import json
+import multiprocessing
 import os
+import re
 import shutil
 import subprocess
 import sys
 import threading
+import time
 import traceback
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from contextlib import closing, nullcontext, redirect_stdout
+from io import StringIO
 from pathlib import Path
 from queue import Empty, Queue
+import tkinter as tk
 from tkinter import filedialog, messagebox
 
 import customtkinter as ctk
 
 IS_WINDOWS = sys.platform == "win32"
 CREATE_NO_WINDOW = 0x08000000 if IS_WINDOWS else 0
+# Minimum seconds between progress/log pushes from busy worker loops
+UI_UPDATE_INTERVAL = 0.1
+# Terminal log is trimmed by LOG_TRIM_LINES once it grows past LOG_MAX_LINES
+LOG_MAX_LINES = 5000
+LOG_TRIM_LINES = 1000
 
 
 def get_app_dir():
@@ -23,39 +38,57 @@ def get_app_dir():
 
 APP_DIR = get_app_dir()
 CONFIG_FILE = os.path.join(APP_DIR, "ogre_tools_config.json")
+NORMALS_CACHE_FILE = os.path.join(APP_DIR, "ogre_normals_cache.json")
+NORMALS_CACHE_MAX = 20000  # oldest entries are dropped beyond this
 
+RESOURCE_DIR = getattr(sys, "_MEIPASS", APP_DIR)
+
+@functools.lru_cache(maxsize=None)
 def get_resource_path(relative_path):
     """Get absolute path to resource for dev and PyInstaller bundling."""
-    try:
-        base_path = sys._MEIPASS
-    except Exception:
-        base_path = APP_DIR
-    return os.path.join(base_path, relative_path)
+    return os.path.join(RESOURCE_DIR, relative_path)
 
 # Ensure current dir is in sys.path for imports
-current_dir = get_resource_path(".")
-if current_dir not in sys.path:
-    sys.path.append(current_dir)
+if RESOURCE_DIR not in sys.path:
+    sys.path.append(RESOURCE_DIR)
+
+try:
+    import recalculate_normals
+except ImportError:
+    recalculate_normals = None
 
 class ConsoleRedirector:
+    """Forwards complete lines to log_func; print() writes text and newline separately."""
     def __init__(self, log_func):
         self.log_func = log_func
+        self._buffer = []
+        self._lock = threading.Lock()
     def write(self, string):
-        if string.strip():
-            self.log_func(string.strip())
+        with self._lock:
+            self._buffer.append(string)
+            if "\n" not in string:
+                return len(string)
+            complete, _, rest = "".join(self._buffer).rpartition("\n")
+            self._buffer = [rest] if rest else []
+        self._emit(complete)
+        return len(string)
     def flush(self):
-        pass
+        with self._lock:
+            pending = "".join(self._buffer)
+            self._buffer = []
+        self._emit(pending)
+    def _emit(self, text):
+        text = text.strip()
+        if text:
+            self.log_func(text)
+
+
+# Longest suffix first; the empty match at the end appends .obj to anything else
+_MESH_SUFFIX_RE = re.compile(r"(?:\.mesh\.xml|\.mesh|\.xml)?\Z", re.IGNORECASE)
 
 
 def obj_output_name(source_name):
-    lower_name = source_name.lower()
-    if lower_name.endswith(".mesh.xml"):
-        return source_name[:-9] + ".obj"
-    if lower_name.endswith(".mesh"):
-        return source_name[:-5] + ".obj"
-    if lower_name.endswith(".xml"):
-        return source_name[:-4] + ".obj"
-    return source_name + ".obj"
+    return _MESH_SUFFIX_RE.sub(".obj", source_name, count=1)
 
 
 def resolve_executable_path(command):
@@ -65,6 +98,202 @@ def resolve_executable_path(command):
         return command if os.path.exists(command) else None
     return shutil.which(command)
 
+
+# FR_PRIVATE fonts live for the whole process, so register BZONE.ttf only once
+_custom_font_loaded = False
+
+MESH_EXTENSIONS = frozenset((".mesh", ".xml"))
+
+
+def file_extension(path):
+    """Lower-cased extension of path, e.g. ".mesh"."""
+    return os.path.splitext(path)[1].lower()
+
+
+def iter_mesh_files(directory, extensions=MESH_EXTENSIONS):
+    """Recursively yield file paths under directory whose extension is in extensions.
+
+    Walks with an explicit stack so only one scandir handle is open at a time
+    and a caller that stops early (e.g. preview) never touches the rest of
+    the tree.
+    """
+    stack = [directory]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    # Like os.walk(): symlinked files are listed, symlinked
+                    # directories are not descended into
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.is_file() and file_extension(entry.name) in extensions:
+                        yield entry.path
+        except OSError:
+            # Match os.walk(): unreadable directories are skipped silently
+            continue
+
+
+@functools.lru_cache(maxsize=1)
+def _load_config_cached(path, mtime_ns):
+    """Parse the config once per on-disk version; mtime_ns is only the cache key."""
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def load_config_file(path=CONFIG_FILE):
+    """Return the parsed config dict, or None if it is missing or unreadable."""
+    try:
+        cfg = _load_config_cached(path, os.stat(path).st_mtime_ns)
+    except (OSError, ValueError):
+        return None
+    return cfg if isinstance(cfg, dict) else None
+
+
+def load_normals_cache():
+    """Load {normcased path: [mtime_ns, size]} for files whose normals were already correct."""
+    try:
+        with open(NORMALS_CACHE_FILE, 'r', encoding='utf-8') as f:
+            cache = json.load(f)
+        return cache if isinstance(cache, dict) else {}
+    except (OSError, ValueError):
+        return {}
+
+
+def save_normals_cache(cache, dirty=True):
+    """Write the cache back, dropping entries for files that no longer exist.
+
+    The write is skipped when nothing was added or removed (dirty=False) and
+    no entry had to be pruned.
+    """
+    stale = [path for path in cache if not os.path.exists(path)]
+    for path in stale:
+        del cache[path]
+    # Dicts keep insertion order, so the first keys are the oldest entries
+    overflow = list(itertools.islice(cache, max(0, len(cache) - NORMALS_CACHE_MAX)))
+    for path in overflow:
+        del cache[path]
+    if not (dirty or stale or overflow):
+        return
+    try:
+        with open(NORMALS_CACHE_FILE, 'w', encoding='utf-8') as f:
+            json.dump(cache, f)
+    except OSError:
+        pass
+
+
+def file_signature(path):
+    st = os.stat(path)
+    return [st.st_mtime_ns, st.st_size]
+
+
+def run_converter(xml_converter, path):
+    """Run OgreXMLConverter on a single file, returning anything it wrote to stderr.
+
+    The converter's stdout is a verbose progress dump nobody reads, so it goes
+    straight to DEVNULL instead of being buffered through a pipe.
+    """
+    result = subprocess.run(
+        [xml_converter, path],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        text=True,
+        creationflags=CREATE_NO_WINDOW,
+    )
+    if result.returncode != 0:
+        raise subprocess.CalledProcessError(
+            result.returncode,
+            [xml_converter, path],
+            stderr=result.stderr,
+        )
+    return result.stderr.strip()
+
+
+def mesh_file_info(path):
+    """Precompute (path, name, is_binary, xml_candidates) for a mesh/XML file."""
+    name = os.path.basename(path)
+    is_binary = file_extension(path) == ".mesh"
+    xml_candidates = (path + ".xml", path[:-5] + ".xml") if is_binary else (path,)
+    return path, name, is_binary, xml_candidates
+
+
+def recalculate_mesh_normals(file_info, xml_converter, capture=True):
+    """Recalculate normals for one .mesh/.xml file described by mesh_file_info().
+
+    Runs in a ProcessPoolExecutor worker, so it must stay at module level and
+    return plain data: (file_info, status, captured_output, error_message,
+    temp_xml). temp_xml is the intermediate XML the caller should delete, or None.
+    Binary meshes whose normals can be verified straight from the .mesh skip
+    the converter entirely; the others pay one pure-Python normals pass (two
+    if it comes out unchanged at 6 digits only) before the usual round-trip.
+    
+    Pass capture=False when calling inline: redirect_stdout swaps the
+    process-wide sys.stdout, which would also swallow the Tk thread's prints.
+    Output then goes straight to stdout and captured_output is empty.
+    """
+    f_path, f_name, is_binary, xml_candidates = file_info
+    log = StringIO()
+    target_xml = f_path
+    temp_xml = None
+    status = None
+    error = None
+
+    try:
+        with redirect_stdout(log) if capture else nullcontext():
+            if is_binary and recalculate_normals.check_binary_mesh_normals(f_path) == "UNCHANGED":
+                print(f"Normals already correct in {f_name} (checked binary mesh directly)")
+                return file_info, "UNCHANGED", log.getvalue(), None, None
+
+            if is_binary:
+                print(f"Running: {xml_converter} {f_path}")
+                print(run_converter(xml_converter, f_path))
+                # The converter writes <name>.mesh.xml; the stripped name is a fallback,
+                # so the happy path costs a single stat
+                temp_xml = next((path for path in xml_candidates if os.path.exists(path)), None)
+                if temp_xml is None:
+                    raise FileNotFoundError(f"Could not find XML for {f_name}")
+                target_xml = temp_xml
+            elif not os.path.exists(target_xml):
+                raise FileNotFoundError(f"Could not find XML for {f_name}")
+
+            status = recalculate_normals.recalculate_normals(target_xml)
+            if status not in ("CHANGED", "UNCHANGED"):
+                raise RuntimeError(f"Normal recalculation failed for {f_name}")
+
+            if temp_xml and status == "CHANGED":
+                print(f"Exporting updated {f_name} back to binary mesh...")
+                print(run_converter(xml_converter, target_xml))
+    except Exception as exc:
+        error = str(exc)
+
+    return file_info, status, log.getvalue(), error, temp_xml
+
+
+def _unlink_quietly(path):
+    try:
+        os.unlink(path)
+    except OSError:
+        pass
+
+
+def process_pool_size(job_count):
+    """Workers for a process pool over job_count jobs.
+
+    Each worker is a fresh interpreter that re-imports this module, so small
+    batches shouldn't spawn one per core; Windows also caps pools at 61.
+    """
+    workers = min(os.cpu_count() or 1, job_count)
+    return min(workers, 61) if IS_WINDOWS else workers
+
+
+def remove_files(paths, max_workers=1):
+    """Delete paths, ignoring missing files; unlinks are syscall-bound so they overlap well."""
+    if max_workers > 1 and len(paths) > 1:
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            pool.map(_unlink_quietly, paths)
+    else:
+        for path in paths:
+            _unlink_quietly(path)
+
 # ── COMMAND LINE MODE (FOR SUBPROCESSES) ──────────────────────────────────────
 # If the EXE is launched with arguments, check if we need to run a tool instead
 # of the GUI. This handles any legacy code using sys.executable subprocess calls.
@@ -88,7 +317,15 @@ class OgreMeshToolsGUI(ctk.CTk):
         super().__init__()
 
         self._ui_queue = Queue()
+        # Worker log lines skip the Queue's lock/notify; deque append/popleft are atomic
+        self._log_queue = deque()
+        # One reusable job thread; destroy() cancels it instead of abandoning a daemon
+        self._executor = ThreadPoolExecutor(max_workers=1)
+        self._cancel_event = threading.Event()
+        self._active_proc = None
         self._main_thread_id = threading.get_ident()
+        self._last_ui_ts = 0.0
+        self._log_buffer = []
 
         self.title("OGRE MESH TOOLS")
         self.geometry("1200x850")
@@ -115,7 +352,10 @@ class OgreMeshToolsGUI(ctk.CTk):
         
         self.configure(fg_color=self.colors["bg"])
         
-        self.resource_dir = get_resource_path(".")
+        self.resource_dir = RESOURCE_DIR
+        self.xml_converter = get_resource_path("OgreXMLConverter.exe")
+        self.xml_converter_dir = os.path.dirname(self.xml_converter)
+        self.gltf_script = get_resource_path("batch_ogre_to_gltf.py")
         self.load_custom_fonts()
         
         # --- VARIABLES ---
@@ -137,32 +377,38 @@ class OgreMeshToolsGUI(ctk.CTk):
         self.after(50, self._process_ui_queue)
         
     def load_config(self):
-        if os.path.exists(CONFIG_FILE):
-            try:
-                with open(CONFIG_FILE, 'r', encoding='utf-8') as f:
-                    cfg = json.load(f)
-                    self.blender_path.set(cfg.get("blender_path", "blender"))
-            except: pass
-        else:
-            self.blender_path.set("blender")
+        cfg = load_config_file()
+        self._saved_config = dict(cfg) if cfg else None
+        self.blender_path.set((cfg or {}).get("blender_path", "blender"))
 
     def save_config(self):
         cfg = {
             "blender_path": self.blender_path.get()
         }
+        # Most saves (every run, every browse) change nothing on disk
+        if cfg == self._saved_config:
+            return
         try:
             with open(CONFIG_FILE, 'w', encoding='utf-8') as f:
                 json.dump(cfg, f, indent=4)
+            self._saved_config = cfg
         except: pass
         
     def load_custom_fonts(self):
+        global _custom_font_loaded
         self.main_font = "Consolas"
+        if _custom_font_loaded:
+            self.main_font = "BZONE"
+            return
         if IS_WINDOWS:
             font_path = get_resource_path("BZONE.ttf")
             if os.path.exists(font_path):
                 # AddFontResourceExW flag 0x10 is FR_PRIVATE (not enumerable by others)
                 import ctypes
-                ctypes.windll.gdi32.AddFontResourceExW(font_path, 0x10, 0)
+                if ctypes.windll.gdi32.AddFontResourceExW(font_path, 0x10, 0) == 0:
+                    print("WARNING: Failed to load custom font BZONE.ttf, using Consolas")
+                    return
+                _custom_font_loaded = True
                 self.main_font = "BZONE"
                 print(f"Loaded custom font: {self.main_font}")
 
@@ -213,14 +459,10 @@ class OgreMeshToolsGUI(ctk.CTk):
 
         ctk.CTkLabel(self.right_col, text="MESH PREVIEW", font=(self.main_font, 12, "bold"), text_color=self.colors["highlight"]).pack(anchor="w", padx=10, pady=(5,0))
         
-        try:
-            import ogre_preview
-            self.preview_frame = ogre_preview.OgrePreviewFrame(self.right_col)
-            self.preview_frame.pack(fill="both", expand=True, padx=10, pady=(5, 10))
-        except ImportError:
-            lbl = ctk.CTkLabel(self.right_col, text="Ogre preview not available.\nRun 'py -3.10 -m pip install ogre-python' first.")
-            lbl.pack(expand=True)
-            self.preview_frame = None
+        # The Ogre viewport (and the Ogre import behind it) is built on the first preview
+        self.preview_frame = None
+        self._preview_placeholder = ctk.CTkLabel(self.right_col, text="Select a .mesh file\nand click PREVIEW", text_color=self.colors["highlight"])
+        self._preview_placeholder.pack(expand=True)
 
         # --- INPUT SECTION ---
         self.input_frame = ctk.CTkFrame(self.left_col, fg_color=self.colors["dark"])
@@ -309,20 +551,61 @@ class OgreMeshToolsGUI(ctk.CTk):
         self.log_label = ctk.CTkLabel(self.left_col, text="TERMINAL OUTPUT", font=(self.main_font, 12, "bold"), text_color=self.colors["highlight"])
         self.log_label.pack(anchor="w", padx=5, pady=(10, 0))
         
-        self.log_box = ctk.CTkTextbox(self.left_col, fg_color="#050505", text_color=self.colors["fg"], font=("Consolas", 12), border_width=1, border_color=self.colors["highlight"])
-        self.log_box.pack(fill="both", expand=True, padx=5, pady=(5, 10))
+        # Plain tk.Text: append-only output doesn't need CTk's per-insert theming.
+        # It has no scrollbar of its own, so one is attached here.
+        self.log_frame = ctk.CTkFrame(self.left_col, fg_color="transparent")
+        self.log_frame.pack(fill="both", expand=True, padx=5, pady=(5, 10))
+        self.log_scroll = ctk.CTkScrollbar(self.log_frame)
+        self.log_scroll.pack(side="right", fill="y")
+        self.log_box = tk.Text(self.log_frame, bg="#050505", fg=self.colors["fg"], font=("Consolas", 12), relief="flat", highlightthickness=1, highlightbackground=self.colors["highlight"], highlightcolor=self.colors["highlight"], wrap="word", state="disabled", yscrollcommand=self.log_scroll.set)
+        self.log_box.pack(side="left", fill="both", expand=True)
+        self.log_scroll.configure(command=self.log_box.yview)
 
     def _queue_ui_call(self, callback, *args, **kwargs):
-        self._ui_queue.put((callback, args, kwargs))
+        self._ui_queue.put(("call", (callback, args, kwargs)))
+
+    def _drain_log_queue(self):
+        lines = []
+        pop = self._log_queue.popleft
+        try:
+            while True:
+                lines.append(pop())
+        except IndexError:
+            pass
+        if lines:
+            self._append_log_ui("\n".join(lines))
+
+    def _apply_progress_ui(self, label, progress):
+        if label is not None:
+            self._set_progress_label_ui(label)
+        if progress is not None:
+            self._set_progress_ui(progress)
 
     def _process_ui_queue(self):
+        # Drain everything pending: log lines are joined into one insert and
+        # only the latest progress label/value is applied.
+        label = None
+        progress = None
         try:
             while True:
-                callback, args, kwargs = self._ui_queue.get_nowait()
-                callback(*args, **kwargs)
+                kind, payload = self._ui_queue.get_nowait()
+                if kind == "progress":
+                    progress = payload
+                elif kind == "label":
+                    label = payload
+                else:
+                    # Updates queued before this call must show first
+                    self._drain_log_queue()
+                    self._apply_progress_ui(label, progress)
+                    label = progress = None
+                    callback, args, kwargs = payload
+                    callback(*args, **kwargs)
         except Empty:
             pass
 
+        self._drain_log_queue()
+        self._apply_progress_ui(label, progress)
+
         try:
             self.after(50, self._process_ui_queue)
         except Exception:
@@ -331,12 +614,17 @@ class OgreMeshToolsGUI(ctk.CTk):
     def _append_log_ui(self, message, color=None):
         if not message:
             return
-        for line in str(message).splitlines():
-            self.log_box.insert("end", f"> {line}\n")
+        self.log_box.configure(state="normal")
+        self.log_box.insert("end", "".join(f"> {line}\n" for line in str(message).splitlines()))
+        if int(self.log_box.index("end-1c").split(".")[0]) > LOG_MAX_LINES:
+            self.log_box.delete("1.0", f"{LOG_TRIM_LINES + 1}.0")
+        self.log_box.configure(state="disabled")
         self.log_box.see("end")
 
     def _clear_log_ui(self):
+        self.log_box.configure(state="normal")
         self.log_box.delete("1.0", "end")
+        self.log_box.configure(state="disabled")
 
     def _set_progress_label_ui(self, text):
         self.progress_label.configure(text=text)
@@ -344,6 +632,10 @@ class OgreMeshToolsGUI(ctk.CTk):
     def _set_progress_ui(self, value):
         self.progress_bar.set(value)
 
+    def _set_stage_ui(self, text, value):
+        self.progress_label.configure(text=text)
+        self.progress_bar.set(value)
+
     def _set_run_state_ui(self, enabled, text):
         self.run_btn.configure(state="normal" if enabled else "disabled", text=text)
 
@@ -360,7 +652,23 @@ class OgreMeshToolsGUI(ctk.CTk):
         if threading.get_ident() == self._main_thread_id:
             self._append_log_ui(text, color=color)
         else:
-            self._queue_ui_call(self._append_log_ui, text, color)
+            self._log_queue.append(text)
+
+    def _buffer_log(self, message):
+        text = str(message).strip()
+        if text:
+            self._log_buffer.append(text)
+
+    def _flush_progress(self, value, force=False):
+        """Push buffered log lines and progress at most every UI_UPDATE_INTERVAL."""
+        now = time.monotonic()
+        if not force and now - self._last_ui_ts < UI_UPDATE_INTERVAL:
+            return
+        self._last_ui_ts = now
+        if self._log_buffer:
+            self.log("\n".join(self._log_buffer))
+            self._log_buffer.clear()
+        self._set_progress(value)
 
     def _clear_log(self):
         if threading.get_ident() == self._main_thread_id:
@@ -372,13 +680,21 @@ class OgreMeshToolsGUI(ctk.CTk):
         if threading.get_ident() == self._main_thread_id:
             self._set_progress_label_ui(text)
         else:
-            self._queue_ui_call(self._set_progress_label_ui, text)
+            self._ui_queue.put(("label", text))
 
     def _set_progress(self, value):
         if threading.get_ident() == self._main_thread_id:
             self._set_progress_ui(value)
         else:
-            self._queue_ui_call(self._set_progress_ui, value)
+            self._ui_queue.put(("progress", value))
+
+    def _set_stage(self, text, value):
+        """Set the progress label and bar together as one UI update."""
+        if threading.get_ident() == self._main_thread_id:
+            self._set_stage_ui(text, value)
+        else:
+            self._ui_queue.put(("label", text))
+            self._ui_queue.put(("progress", value))
 
     def _set_run_state(self, enabled, text):
         if threading.get_ident() == self._main_thread_id:
@@ -412,28 +728,29 @@ class OgreMeshToolsGUI(ctk.CTk):
 
         return None
 
-    def _run_command(self, cmd, check=True):
+    def _stream_command(self, cmd):
+        """Run cmd, forwarding each stdout/stderr line to the log as it arrives."""
         self.log(f"Running: {' '.join(str(part) for part in cmd)}")
-        result = subprocess.run(
+        proc = subprocess.Popen(
             cmd,
-            capture_output=True,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
             text=True,
+            errors="replace",
+            bufsize=1,
             creationflags=CREATE_NO_WINDOW,
         )
-
-        if result.stdout.strip():
-            self.log(result.stdout.strip())
-        if result.stderr.strip():
-            self.log(result.stderr.strip(), self.colors["warning"])
-
-        if check and result.returncode != 0:
-            raise subprocess.CalledProcessError(
-                result.returncode,
-                cmd,
-                output=result.stdout,
-                stderr=result.stderr,
-            )
-        return result
+        self._active_proc = proc
+        try:
+            with proc.stdout:
+                for line in proc.stdout:
+                    self.log(line.rstrip())
+                    if self._cancel_event.is_set():
+                        proc.kill()
+                        break
+            return proc.wait()
+        finally:
+            self._active_proc = None
 
     @staticmethod
     def _summarize_errors(errors):
@@ -464,13 +781,18 @@ class OgreMeshToolsGUI(ctk.CTk):
         if d: self.output_path.set(d)
 
     def open_output_folder(self):
-        if self.last_output_dir and os.path.exists(self.last_output_dir):
+        if self.last_output_dir:
             if IS_WINDOWS:
-                os.startfile(self.last_output_dir)
-            else:
-                subprocess.run(["xdg-open", self.last_output_dir], creationflags=CREATE_NO_WINDOW)
-        else:
-            messagebox.showinfo("Note", "No export directory has been created yet.")
+                # startfile fails on a missing folder itself; no separate stat needed
+                try:
+                    os.startfile(self.last_output_dir)
+                    return
+                except OSError:
+                    pass
+            elif os.path.isdir(self.last_output_dir):
+                subprocess.run(["xdg-open", self.last_output_dir])
+                return
+        messagebox.showinfo("Note", "No export directory has been created yet.")
 
     def preview_mesh(self):
         path = self.input_path.get()
@@ -480,32 +802,41 @@ class OgreMeshToolsGUI(ctk.CTk):
             return
             
         if self.batch_mode.get():
-            # In batch mode, try to find the first .mesh file to preview
-            for root, _, files in os.walk(path):
-                for f in files:
-                    if f.lower().endswith('.mesh'):
-                        path = os.path.join(root, f)
-                        break
-                if path.lower().endswith('.mesh'):
-                    break
-                    
-            if not path.lower().endswith('.mesh'):
+            # In batch mode, preview the first .mesh file found; closing the
+            # walk right away releases its open scandir handle
+            with closing(iter_mesh_files(path, (".mesh",))) as meshes:
+                path = next(meshes, None)
+            if path is None:
                 messagebox.showerror("Error", "No .mesh files found in the selected batch directory to preview.")
                 return
                 
-        if not path.lower().endswith('.mesh'):
+        if file_extension(path) != ".mesh":
             messagebox.showerror("Error", "Selected file is not a valid .mesh file.")
             return
             
         self.log(f"Loading native preview for: {os.path.basename(path)}")
         try:
-            if self.preview_frame:
+            if self._ensure_preview_frame():
                 self.preview_frame.load_mesh(path)
             else:
-                self.log("Preview frame failed to initialize earlier.", self.colors["warning"])
+                self.log("Ogre preview not available. Run 'py -3.10 -m pip install ogre-python' first.", self.colors["warning"])
         except Exception as e:
             self.log(f"Failed to load mesh in viewer: {str(e)}", self.colors["warning"])
 
+    def _ensure_preview_frame(self):
+        if self.preview_frame is None and self._preview_placeholder is not None:
+            try:
+                import ogre_preview
+            except ImportError:
+                self._preview_placeholder.configure(text="Ogre preview not available.\nRun 'py -3.10 -m pip install ogre-python' first.")
+                self._preview_placeholder = None
+                return None
+            self._preview_placeholder.destroy()
+            self._preview_placeholder = None
+            self.preview_frame = ogre_preview.OgrePreviewFrame(self.right_col)
+            self.preview_frame.pack(fill="both", expand=True, padx=10, pady=(5, 10))
+        return self.preview_frame
+
     def start_process(self):
         input_path = self.input_path.get().strip()
         if not input_path or not os.path.exists(input_path):
@@ -533,135 +864,196 @@ class OgreMeshToolsGUI(ctk.CTk):
         self._set_progress(0)
         self.log("Starting operation sequence...")
 
-        thread = threading.Thread(target=self.run_operations, args=(job,), daemon=True)
-        thread.start()
+        self._cancel_event.clear()
+        self._executor.submit(self.run_operations, job)
 
     def run_operations(self, job):
         errors = []
+        kept_xmls = []
 
         try:
             input_p = job["input_path"]
             requested_output = job["output_path"]
-            xml_converter = get_resource_path("OgreXMLConverter.exe")
+            xml_converter = self.xml_converter
             is_batch = job["batch_mode"]
+            # Later stages that read <mesh>.xml beside the source can reuse the normals-stage XML
+            reuse_xml = job["do_gltf"] or (job["do_obj"] and not is_batch)
+            # Default exports land next to the input: inside the batch dir, or beside the file
+            base_out = input_p if is_batch else os.path.dirname(input_p)
             blender_exe = self._validate_job_tools(job, xml_converter)
 
-            files_to_process = []
             if is_batch:
-                for root, _, files in os.walk(input_p):
-                    for f in files:
-                        if f.lower().endswith((".mesh", ".xml")):
-                            files_to_process.append(os.path.join(root, f))
+                files_to_process = list(map(mesh_file_info, iter_mesh_files(input_p)))
             else:
-                files_to_process = [input_p]
+                files_to_process = [mesh_file_info(input_p)]
 
-            if job["do_normals"]:
+            if job["do_normals"] and recalculate_normals is None:
+                errors.append("Normals: recalculate_normals module unavailable")
+                self.log("WARNING: recalculate_normals module unavailable", self.colors["warning"])
+            elif job["do_normals"]:
                 self.log(f"--- STARTING NORMAL RECALCULATION ({len(files_to_process)} files) ---")
                 self._set_progress_label("RECALCULATING NORMALS...")
-                import recalculate_normals
-
                 corrected_count = 0
                 total_files = max(len(files_to_process), 1)
-                for i, f_path in enumerate(files_to_process):
-                    progress = (i / total_files) * 0.33 if (job["do_obj"] or job["do_gltf"]) else (i / total_files)
-                    self._set_progress(progress)
-
-                    f_name = os.path.basename(f_path)
-                    target_xml = f_path
-                    temp_xml = None
-
+                scale = 0.33 if (job["do_obj"] or job["do_gltf"]) else 1.0
+
+                # Skip files whose normals were verified correct and which have
+                # not been touched since (same mtime and size).
+                normals_cache = load_normals_cache()
+                cache_dirty = False
+                cache_keys = {}
+                pending = []
+                for file_info in files_to_process:
+                    f_path, f_name = file_info[:2]
+                    cache_key = cache_keys[f_path] = os.path.normcase(f_path)
                     try:
-                        if f_path.lower().endswith(".mesh"):
-                            self._run_command([xml_converter, f_path])
-                            candidate_paths = [f_path + ".xml", os.path.splitext(f_path)[0] + ".xml"]
-                            temp_xml = next((path for path in candidate_paths if os.path.exists(path)), None)
-                            target_xml = temp_xml or candidate_paths[0]
-
-                        if not os.path.exists(target_xml):
-                            raise FileNotFoundError(f"Could not find XML for {f_name}")
-
-                        status = recalculate_normals.recalculate_normals(target_xml)
-                        if status == "CHANGED":
-                            self.log(f"UPDATED: Corrected normals for {f_name}")
+                        cached = normals_cache.get(cache_key) == file_signature(f_path)
+                    except OSError:
+                        cached = False
+                    if cached:
+                        self._buffer_log(f"CACHED: Normals already correct for {f_name}")
+                    else:
+                        pending.append(file_info)
+                cached_count = len(files_to_process) - len(pending)
+
+                if len(pending) > 1:
+                    executor = ProcessPoolExecutor(max_workers=process_pool_size(len(pending)))
+                    futures = [executor.submit(recalculate_mesh_normals, f, xml_converter) for f in pending]
+                    results = (future.result() for future in as_completed(futures))
+                else:
+                    executor = None
+                    results = (recalculate_mesh_normals(f, xml_converter, capture=False) for f in pending)
+
+                temp_xmls = []
+                failed_xmls = set()
+                try:
+                    for i, (file_info, status, output, error, temp_xml) in enumerate(results, cached_count + 1):
+                        if temp_xml:
+                            temp_xmls.append(temp_xml)
+                        if self._cancel_event.is_set():
+                            break
+                        f_path, f_name = file_info[:2]
+                        self._buffer_log(output)
+
+                        if status != "UNCHANGED" and normals_cache.pop(cache_keys[f_path], None) is not None:
+                            # Touched since it was verified; the old entry can never match again
+                            cache_dirty = True
+
+                        if error:
+                            failed_xmls.add(temp_xml)
+                            errors.append(f"Normals: {f_name}: {error}")
+                            self._buffer_log(f"WARNING: {f_name}: {error}")
+                        elif status == "CHANGED":
+                            self._buffer_log(f"UPDATED: Corrected normals for {f_name}")
                             corrected_count += 1
-                        elif status == "UNCHANGED":
-                            self.log(f"CHECKED: Normals already correct for {f_name}")
                         else:
-                            raise RuntimeError(f"Normal recalculation failed for {f_name}")
-
-                        if temp_xml and status == "CHANGED":
-                            self.log(f"Exporting updated {f_name} back to binary mesh...")
-                            self._run_command([xml_converter, target_xml])
-                    except Exception as exc:
-                        errors.append(f"Normals: {f_name}: {exc}")
-                        self.log(f"WARNING: {f_name}: {exc}", self.colors["warning"])
-                    finally:
-                        if temp_xml and os.path.exists(temp_xml):
+                            self._buffer_log(f"CHECKED: Normals already correct for {f_name}")
                             try:
-                                os.remove(temp_xml)
+                                normals_cache[cache_keys[f_path]] = file_signature(f_path)
+                                cache_dirty = True
                             except OSError:
                                 pass
 
+                        self._flush_progress((i / total_files) * scale)
+                finally:
+                    if executor is not None:
+                        executor.shutdown(wait=True, cancel_futures=True)
+                        # Workers still running when the loop was cancelled leave XMLs too
+                        for future in futures:
+                            if future.done() and not future.cancelled() and future.exception() is None:
+                                temp_xml = future.result()[4]
+                                if temp_xml and temp_xml not in temp_xmls:
+                                    temp_xmls.append(temp_xml)
+                    self._flush_progress(scale, force=True)
+                    save_normals_cache(normals_cache, dirty=cache_dirty)
+                    if reuse_xml and not self._cancel_event.is_set():
+                        # The XMLs already carry the recalculated normals; the
+                        # glTF importer and single-file OBJ pick them up in place
+                        # of running the converter again.
+                        kept_xmls = [path for path in temp_xmls if path not in failed_xmls]
+                        temp_xmls = [path for path in temp_xmls if path in failed_xmls]
+                    if temp_xmls:
+                        # Removed before the next stage starts: the single-file
+                        # OBJ step rewrites <mesh>.xml beside the source, and the
+                        # glTF importer reuses any <mesh>.xml it finds
+                        remove_files(temp_xmls, max_workers=8)
+
                 self.log(f"--- NORMAL RECALCULATION COMPLETE: {corrected_count}/{len(files_to_process)} corrected ---")
 
-            if job["do_obj"]:
-                self._set_progress_label("CONVERTING TO OBJ...")
-                self._set_progress(0.5 if job["do_gltf"] else 0.8)
+            if job["do_obj"] and not self._cancel_event.is_set():
+                self._set_stage("CONVERTING TO OBJ...", 0.5 if job["do_gltf"] else 0.8)
                 self.log("--- STARTING OBJ CONVERSION ---")
 
                 try:
                     import MeshToObj
 
-                    default_output = os.path.join(
-                        input_p if is_batch else os.path.dirname(input_p),
-                        "OBJ_Export",
-                    )
+                    default_output = os.path.join(base_out, "OBJ_Export")
                     output_dir = self._resolve_output_dir(requested_output, default_output)
                     self.last_output_dir = output_dir
 
-                    xml_conv = MeshToObj.OgreXMLConverter(os.path.dirname(xml_converter))
+                    xml_conv = MeshToObj.OgreXMLConverter(self.xml_converter_dir)
 
                     if is_batch:
                         output_p = Path(output_dir)
                         xml_dir = output_p / "xml_temp"
                         xml_dir.mkdir(parents=True, exist_ok=True)
+                        xml_files = []
 
                         try:
                             self.log("Converting meshes to XML...")
+                            # One OgreXMLConverter process per job thread
+                            mesh_count = sum(1 for file_info in files_to_process if file_info[2])
                             xml_files = xml_conv.batch_convert(
                                 input_p,
                                 xml_dir,
                                 extensions=[".mesh"],
+                                max_workers=process_pool_size(max(mesh_count, 1)),
+                                cancel_event=self._cancel_event,
                             )
-                            if not xml_files:
+                            if not xml_files and not self._cancel_event.is_set():
                                 raise RuntimeError("No .mesh files were converted to XML.")
 
-                            self.log("Converting XML to OBJ...")
-                            for xml_f in xml_files:
-                                xml_path = Path(xml_f)
-                                rel_xml = xml_path.relative_to(xml_dir)
-                                obj_rel = rel_xml.with_name(obj_output_name(rel_xml.name))
-                                obj_file = output_p / obj_rel
-                                obj_file.parent.mkdir(parents=True, exist_ok=True)
-
-                                converter = MeshToObj.OgreXMLToOBJ()
-                                converter.convert(
-                                    xml_f,
-                                    obj_file,
-                                    create_mtl=True,
-                                    texture_search_roots=[input_p],
-                                )
+                            if not self._cancel_event.is_set():
+                                self.log("Converting XML to OBJ...")
+                                # Plain string paths: this runs once per file in the batch
+                                output_root = str(output_p)
+                                xml_prefix = str(xml_dir) + os.sep
+                                created_dirs = {output_root}
+                                obj_jobs = []
+                                for xml_f in xml_files:
+                                    # batch_convert builds every XML path under xml_dir
+                                    rel_xml = xml_f[len(xml_prefix):] if xml_f.startswith(xml_prefix) else os.path.relpath(xml_f, xml_prefix)
+                                    rel_dir, xml_name = os.path.split(rel_xml)
+                                    obj_dir = os.path.join(output_root, rel_dir) if rel_dir else output_root
+                                    if obj_dir not in created_dirs:
+                                        os.makedirs(obj_dir, exist_ok=True)
+                                        created_dirs.add(obj_dir)
+                                    obj_jobs.append((xml_f, os.path.join(obj_dir, obj_output_name(xml_name)), True, [input_p]))
+
+                                for xml_f, output, error in MeshToObj.convert_obj_jobs(obj_jobs, max_workers=process_pool_size(len(obj_jobs))):
+                                    if self._cancel_event.is_set():
+                                        break
+                                    self.log(output)
+                                    if error:
+                                        rel_xml = os.path.relpath(xml_f, xml_prefix)
+                                        errors.append(f"OBJ: {rel_xml}: {error}")
+                                        self.log(f"OBJ ERROR: {rel_xml}: {error}", self.colors["warning"])
                         finally:
+                            # Delete the known XMLs directly; rmtree then only
+                            # sweeps the empty directory skeleton.
+                            remove_files(xml_files, max_workers=8)
                             if xml_dir.exists():
                                 shutil.rmtree(xml_dir, ignore_errors=True)
                     else:
                         output_p = Path(output_dir)
-                        output_p.mkdir(parents=True, exist_ok=True)
                         target_obj = output_p / obj_output_name(Path(input_p).name)
 
                         cleanup_xml = False
-                        if input_p.lower().endswith(".xml"):
+                        if file_extension(input_p) == ".xml":
                             xml_f = input_p
+                        elif input_p + ".xml" in kept_xmls and os.path.exists(input_p + ".xml"):
+                            self.log("Reusing XML from normal recalculation...")
+                            xml_f = input_p + ".xml"
                         else:
                             xml_f = xml_conv.convert_to_xml(input_p)
                             cleanup_xml = True
@@ -686,54 +1078,48 @@ class OgreMeshToolsGUI(ctk.CTk):
                     errors.append(f"OBJ: {exc}")
                     self.log(f"OBJ ERROR: {exc}", self.colors["warning"])
 
-            if job["do_gltf"]:
-                self._set_progress_label("CONVERTING TO glTF (BLENDER)...")
-                self._set_progress(0.9)
+            if job["do_gltf"] and not self._cancel_event.is_set():
+                self._set_stage("CONVERTING TO glTF (BLENDER)...", 0.9)
                 self.log("--- STARTING glTF CONVERSION (Blender) ---")
 
                 try:
-                    gltf_script = get_resource_path("batch_ogre_to_gltf.py")
-                    default_output = os.path.join(
-                        input_p if is_batch else os.path.dirname(input_p),
-                        "glTF_Export",
-                    )
+                    default_output = os.path.join(base_out, "glTF_Export")
                     output_dir = self._resolve_output_dir(requested_output, default_output)
                     self.last_output_dir = output_dir
 
-                    if not is_batch and not input_p.lower().endswith(".mesh"):
+                    if not is_batch and file_extension(input_p) != ".mesh":
                         raise RuntimeError("Single-file glTF conversion requires a .mesh input.")
 
-                    result = self._run_command(
+                    returncode = self._stream_command(
                         [
                             blender_exe,
                             "-b",
                             "-P",
-                            gltf_script,
+                            self.gltf_script,
                             "--",
                             input_p,
                             output_dir,
                             xml_converter,
-                        ],
-                        check=False,
+                        ]
                     )
-                    if result.returncode != 0:
-                        raise RuntimeError(f"Blender exited with code {result.returncode}.")
+                    if returncode != 0:
+                        raise RuntimeError(f"Blender exited with code {returncode}.")
 
                     self.log("glTF Conversion completed.")
                 except Exception as exc:
                     errors.append(f"glTF: {exc}")
                     self.log(f"glTF ERROR: {exc}", self.colors["warning"])
 
-            self._set_progress(1.0)
-
-            if errors:
+            if self._cancel_event.is_set():
+                self._set_progress_label("CANCELLED")
+                self.log("OPERATION SEQUENCE CANCELLED.", self.colors["warning"])
+            elif errors:
                 summary = self._summarize_errors(errors)
-                self._set_progress_label("COMPLETE WITH ERRORS")
-                self.log("OPERATION SEQUENCE COMPLETED WITH ERRORS.", self.colors["warning"])
-                self.log(summary, self.colors["warning"])
+                self._set_stage("COMPLETE WITH ERRORS", 1.0)
+                self.log(f"OPERATION SEQUENCE COMPLETED WITH ERRORS.\n{summary}", self.colors["warning"])
                 self._show_message("error", "Completed With Errors", summary)
             else:
-                self._set_progress_label("COMPLETE")
+                self._set_stage("COMPLETE", 1.0)
                 self.log("OPERATION SEQUENCE COMPLETE.", self.colors["highlight"])
                 self._show_message("info", "Success", "All operations completed successfully.")
 
@@ -743,8 +1129,24 @@ class OgreMeshToolsGUI(ctk.CTk):
             self.log(traceback.format_exc(), self.colors["warning"])
             self._show_message("error", "Error", f"An error occurred: {exc}")
         finally:
+            # Blender deletes the XMLs it imported; this catches the rest
+            remove_files(kept_xmls)
             self._set_run_state(True, "PROCESS MESHES")
 
+    def destroy(self):
+        # Stop the running job: kill a live Blender process and drop queued work
+        self._cancel_event.set()
+        proc = self._active_proc
+        if proc is not None and proc.poll() is None:
+            try:
+                proc.kill()
+            except OSError:
+                pass
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        super().destroy()
+
 if __name__ == "__main__":
+    # Frozen builds re-launch this EXE for ProcessPoolExecutor workers
+    multiprocessing.freeze_support()
     app = OgreMeshToolsGUI()
     app.mainloop()
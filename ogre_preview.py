@@ -9,10 +9,17 @@ Strategy:
     which would spawn an unwanted SDL/OS window.
   - Drive the render loop via Tkinter's after() scheduler.
   - Mouse orbit / zoom / pan implemented natively in Tkinter.
+
+Importing this module loads the Ogre bindings (and their DLLs), which the
+_EmbeddedOgreContext base class needs at definition time. Import it lazily:
+the GUI only does so on the first PREVIEW click.
 """
 
+import atexit
 import os
 import math
+import threading
+import time
 import tkinter as tk
 from tkinter import messagebox
 import customtkinter as ctk
@@ -38,19 +45,62 @@ else:
 
 LOG_FILE = os.path.join(_log_dir, "OgrePreview.log")
 
+# Per-location / per-material detail while loading a mesh. Off by default:
+# stdout is the GUI log, and large assets print hundreds of lines per load.
+DEBUG_PREVIEW = False
+
+# One handle for the whole session; line buffering still gets every message
+# to disk before a crash, without an open() per call
+_LOG_LOCK = threading.Lock()
+try:
+    _LOG_FH = open(LOG_FILE, "a", buffering=1)
+    atexit.register(_LOG_FH.close)
+except OSError as e:
+    _LOG_FH = None
+    sys.stderr.write(f"[LOG_ERROR] {e} while opening {LOG_FILE}\n")
+
 def log_msg(msg):
-    try:
-        with open(LOG_FILE, "a") as f:
-            f.write(f"{msg}\n")
-            f.flush() # Force write to disk
-    except Exception as e:
-        # Fallback to sys.stderr if file write fails
-        sys.stderr.write(f"[LOG_ERROR] {e} while logging: {msg}\n")
+    if _LOG_FH is not None:
+        try:
+            with _LOG_LOCK:
+                _LOG_FH.write(f"{msg}\n")
+        except Exception as e:
+            # Fallback to sys.stderr if file write fails
+            sys.stderr.write(f"[LOG_ERROR] {e} while logging: {msg}\n")
     print(msg)
 
+def reset_log(header):
+    """Truncate the log to start a new session."""
+    if _LOG_FH is None:
+        return
+    try:
+        with _LOG_LOCK:
+            _LOG_FH.seek(0)
+            _LOG_FH.truncate()
+            _LOG_FH.write(f"{header}\n")
+    except Exception:
+        pass
+
 log_msg(f"--- ogre_preview.py loaded. System: {sys.platform}. Log: {LOG_FILE} ---")
 
 
+# Orbit angles are kept in degrees; one multiply beats a math.radians() call
+_DEG_TO_RAD = math.pi / 180.0
+
+# The Media tree ships with the bindings and doesn't change while we run, but
+# every new context (closeApp() destroys Root and its ResourceGroupManager)
+# has to register it again. Walk it once per process.
+_MEDIA_DIRS = None
+
+def _ogre_media_dirs(possible_paths):
+    """Every directory under the first existing Ogre Media folder, walked once."""
+    global _MEDIA_DIRS
+    if _MEDIA_DIRS is None:
+        media_dir = next((p for p in possible_paths if os.path.exists(p)), None)
+        _MEDIA_DIRS = [root_dir for root_dir, _, _ in os.walk(media_dir)] if media_dir else []
+    return _MEDIA_DIRS
+
+
 # ---------------------------------------------------------------------------
 # We subclass ApplicationContext only for its bootstrap (createRoot, plugin
 # loading, RTShader init, resource loading).  setup() is fully overridden
@@ -73,6 +123,16 @@ class _EmbeddedOgreContext(OgreBites.ApplicationContext if OgreBites else object
         self._mesh_node = None
         self._rg = "OgrePreviewGroup"
         self._rg_created = False
+        # normcased mesh dir -> (time scanned, resource locations)
+        self._loc_cache = {}
+        # Texture lookup table for the current mesh; see _texture_index()
+        self._tex_index = None
+        # normcased dirs already added to self._rg. Ogre keeps locations across
+        # clearResourceGroup(), and each add re-enumerates the directory.
+        self._registered_locs = set()
+        self._rg_initialised = False
+        # Set by anything that changes the picture; render_frame() is a no-op otherwise
+        self._needs_redraw = True
 
     # ------------------------------------------------------------------
     # Override setup() — never calls super().setup() or createWindow()
@@ -202,17 +262,12 @@ class _EmbeddedOgreContext(OgreBites.ApplicationContext if OgreBites else object
                 ogre_pkg_dir = os.path.dirname(ogre_spec.origin)
                 possible_paths.append(os.path.join(ogre_pkg_dir, "Media"))
 
-            ogre_media_dir = None
-            for p in possible_paths:
-                if os.path.exists(p):
-                    ogre_media_dir = p
-                    break
-            
-            if ogre_media_dir:
+            media_dirs = _ogre_media_dirs(possible_paths)
+            if media_dirs:
                 log_msg(f"[OgrePreview] Registering Ogre Media folders into 'General' group...")
                 # Recursively add ALL subfolders of Media to 'General'
                 # Includes RTShaderLib, Main, Terrain, etc.
-                for root_dir, _, _ in os.walk(ogre_media_dir):
+                for root_dir in media_dirs:
                     _rgm.addResourceLocation(root_dir, "FileSystem", "General")
                     # Too verbose for final log, but helpful for now
                     # log_msg(f"  + Added: {os.path.basename(root_dir)}")
@@ -244,8 +299,11 @@ class _EmbeddedOgreContext(OgreBites.ApplicationContext if OgreBites else object
     # Mesh loading / swapping
     # ------------------------------------------------------------------
     # Names of sibling/parent subdirectories to auto-scan for resources
-    _RESOURCE_DIRS = {"materials", "textures", "programs", "shaders",
-                      "fonts", "overlays", "packs"}
+    _RESOURCE_DIRS = frozenset({"materials", "textures", "programs", "shaders",
+                                "fonts", "overlays", "packs"})
+    # Seconds a directory scan is reused; long enough for browsing one pack,
+    # short enough to notice folders added while the app is open
+    _LOC_CACHE_TTL = 60.0
 
     def _collect_resource_locations(self, mesh_dir: str) -> list:
         """
@@ -266,15 +324,38 @@ class _EmbeddedOgreContext(OgreBites.ApplicationContext if OgreBites else object
               - If its name is a known resource dir → add it + its subdirs.
               - Otherwise → check one level inside it for resource subdirs
                 (this catches BZ_ASSETS/pc/{materials,textures}).
+
+        Results are cached per mesh directory for _LOC_CACHE_TTL seconds, so
+        previewing several meshes from one pack scans the tree once.
         """
-        locations = [mesh_dir]
-        seen = {os.path.normcase(mesh_dir)}
+        cache_key = os.path.normcase(mesh_dir)
+        cached = self._loc_cache.get(cache_key)
+        if cached and time.monotonic() - cached[0] < self._LOC_CACHE_TTL:
+            return list(cached[1])
+
+        locations = self._scan_resource_locations(mesh_dir)
+        self._loc_cache[cache_key] = (time.monotonic(), locations)
+        return list(locations)
+
+    def _scan_resource_locations(self, mesh_dir: str) -> list:
+        # First spelling of each directory wins; dict keeps discovery order
+        unique = {}
+        for path in self._iter_resource_dirs(mesh_dir):
+            unique.setdefault(os.path.normcase(path), path)
+        return list(unique.values())
+
+    @staticmethod
+    def _subdirs(path: str):
+        try:
+            with os.scandir(path) as entries:
+                return [entry for entry in entries if entry.is_dir()]
+        except OSError:
+            return []
 
-        def _add(path):
-            key = os.path.normcase(path)
-            if key not in seen:
-                locations.append(path)
-                seen.add(key)
+    def _iter_resource_dirs(self, mesh_dir: str):
+        """Yield candidate resource dirs in priority order (duplicates included)."""
+        res_dirs = self._RESOURCE_DIRS
+        yield mesh_dir
 
         current = mesh_dir
         for _ in range(6):
@@ -282,43 +363,24 @@ class _EmbeddedOgreContext(OgreBites.ApplicationContext if OgreBites else object
             if parent == current:
                 break
             current = parent
-            _add(current)
-
-            try:
-                for entry in os.scandir(current):
-                    if not entry.is_dir():
-                        continue
-                    name_l = entry.name.lower()
-
-                    if name_l in self._RESOURCE_DIRS:
-                        # Direct resource dir — add it + one level of subdirs
-                        _add(entry.path)
-                        try:
-                            for sub in os.scandir(entry.path):
-                                if sub.is_dir():
-                                    _add(sub.path)
-                        except OSError:
-                            pass
-                    else:
-                        # Non-resource sibling (e.g. 'pc') — look one level
-                        # inside for resource-named subdirs
-                        try:
-                            for sub in os.scandir(entry.path):
-                                if sub.is_dir() and sub.name.lower() in self._RESOURCE_DIRS:
-                                    _add(sub.path)
-                                    # One more level inside those too
-                                    try:
-                                        for subsub in os.scandir(sub.path):
-                                            if subsub.is_dir():
-                                                _add(subsub.path)
-                                    except OSError:
-                                        pass
-                        except OSError:
-                            pass
-            except OSError:
-                pass
-
-        return locations
+            yield current
+
+            for entry in self._subdirs(current):
+                name = entry.name
+                if name in res_dirs or name.lower() in res_dirs:
+                    # Direct resource dir — add it + one level of subdirs
+                    yield entry.path
+                    for sub in self._subdirs(entry.path):
+                        yield sub.path
+                else:
+                    # Non-resource sibling (e.g. 'pc') — look one level
+                    # inside for resource-named subdirs
+                    for sub in self._subdirs(entry.path):
+                        if sub.name in res_dirs or sub.name.lower() in res_dirs:
+                            yield sub.path
+                            # One more level inside those too
+                            for subsub in self._subdirs(sub.path):
+                                yield subsub.path
 
 
     def load_mesh(self, mesh_path: str):
@@ -339,22 +401,27 @@ class _EmbeddedOgreContext(OgreBites.ApplicationContext if OgreBites else object
                 pass
             self._rg_created = True
 
-        try:
-            rgm.clearResourceGroup(self._rg)
-        except Exception:
-            pass
-
-        # Register all discovered resource directories (BZ_ASSETS tree scan)
+        # Register all discovered resource directories (BZ_ASSETS tree scan).
+        # Another mesh from the same pack needs no new locations, so the
+        # group is only rebuilt when something was actually added.
         locations = self._collect_resource_locations(file_dir)
-        print(f"[OgrePreview] Adding {len(locations)} resource location(s):")
-        for loc in locations:
+        new_locations = [loc for loc in locations
+                         if os.path.normcase(loc) not in self._registered_locs]
+        if new_locations or not self._rg_initialised:
             try:
-                rgm.addResourceLocation(loc, "FileSystem", self._rg)
-                print(f"  + {loc}")
+                rgm.clearResourceGroup(self._rg)
             except Exception:
                 pass
 
-        rgm.initialiseResourceGroup(self._rg)
+            print(f"[OgrePreview] Adding {len(new_locations)} resource location(s)")
+            for loc in new_locations:
+                self._add_location(loc)
+                if DEBUG_PREVIEW:
+                    print(f"  + {loc}")
+
+            rgm.initialiseResourceGroup(self._rg)
+            self._rg_initialised = True
+        self._tex_index = None
 
         self._mesh_entity = self._scn_mgr.createEntity(file_name)
         self._mesh_node = self._scn_mgr.getRootSceneNode().createChildSceneNode()
@@ -375,52 +442,84 @@ class _EmbeddedOgreContext(OgreBites.ApplicationContext if OgreBites else object
 
         self._cam.setNearClipDistance(max(0.01, diam * 0.005))
         self._cam.setFarClipDistance(diam * 500.0)
+        self._needs_redraw = True
 
         return diam  # return for camera init in caller
 
     # Texture file extensions to search, in priority order
     _TEX_EXTS = {".dds", ".png", ".tga", ".jpg", ".bmp"}
+    _TEX_EXT_TUPLE = tuple(sorted(_TEX_EXTS))  # for one str.endswith() call
+    # Diffuse-map suffixes, in priority order; matching is case-insensitive
+    # so "_A", "_D" and "_DIFF" are covered too
+    _TEX_SUFFIXES = ("_a", "_d", "_diff", "")
+
+    def _add_location(self, path: str):
+        key = os.path.normcase(path)
+        if key in self._registered_locs:
+            return
+        try:
+            Ogre.ResourceGroupManager.getSingleton().addResourceLocation(path, "FileSystem", self._rg)
+            self._registered_locs.add(key)
+        except Exception:
+            pass
 
-    def _find_texture(self, base_name: str, locations: list) -> "str | None":
+    def _texture_index(self, locations: list) -> list:
         """
-        Case-insensitive search for a texture by base name across all
-        resource locations (and one level of subdirectories).
-        Returns the ACTUAL filename on disk so Ogre can locate it, or None.
+        [(dirpath, is_subdir, {lower base name: actual filename})] for every
+        resource location and its immediate subdirectories, in search order.
+        Built on first use per mesh, so each directory is scanned once no
+        matter how many materials and name variants are looked up.
         """
-        target_lower = base_name.lower()
+        if self._tex_index is not None:
+            return self._tex_index
+        tex_exts = self._TEX_EXT_TUPLE
 
-        def _scan_dir(dirpath):
+        def _scan(dirpath, is_subdir, index):
+            names = {}
+            subdirs = []
             try:
-                for entry in os.scandir(dirpath):
-                    if not entry.is_file():
-                        continue
-                    name, ext = os.path.splitext(entry.name)
-                    if name.lower() == target_lower and ext.lower() in self._TEX_EXTS:
-                        return entry.name  # actual disk name
+                with os.scandir(dirpath) as entries:
+                    for entry in entries:
+                        if entry.is_dir():
+                            subdirs.append(entry.path)
+                        elif entry.is_file():
+                            low = entry.name.lower()
+                            if low.endswith(tex_exts):
+                                names.setdefault(low[:low.rfind('.')], entry.name)
             except OSError:
                 pass
-            return None
+            if names:
+                index.append((dirpath, is_subdir, names))
+            return subdirs
 
+        index = []
         for loc in locations:
-            result = _scan_dir(loc)
-            if result:
-                return result
-            # One level deeper (e.g. DIFF/, EMIS/, SPEC/ subdirs)
-            try:
-                for sub in os.scandir(loc):
-                    if sub.is_dir():
-                        result = _scan_dir(sub.path)
-                        if result:
-                            # Also register this subdir in the resource group
-                            # so Ogre can actually load the file
-                            try:
-                                rgm = Ogre.ResourceGroupManager.getSingleton()
-                                rgm.addResourceLocation(sub.path, "FileSystem", self._rg)
-                            except Exception:
-                                pass
-                            return result
-            except OSError:
-                pass
+            # One level deeper too (e.g. DIFF/, EMIS/, SPEC/ subdirs)
+            for sub in _scan(loc, False, index):
+                _scan(sub, True, index)
+        self._tex_index = index
+        return index
+
+    def _find_texture(self, base_name: str, locations: list) -> "str | None":
+        """
+        Case-insensitive search for a texture by base name across all
+        resource locations (and one level of subdirectories).
+        Returns the ACTUAL filename on disk so Ogre can locate it, or None.
+        """
+        return self._find_texture_any((base_name.lower(),), locations)
+
+    def _find_texture_any(self, candidates, locations: list) -> "str | None":
+        """First hit for lower-cased base names tried in order; see _find_texture()."""
+        index = self._texture_index(locations)
+        for target_lower in candidates:
+            for dirpath, is_subdir, names in index:
+                actual = names.get(target_lower)
+                if actual:
+                    if is_subdir:
+                        # Also register this subdir in the resource group
+                        # so Ogre can actually load the file
+                        self._add_location(dirpath)
+                    return actual
         return None
 
 
@@ -431,34 +530,39 @@ class _EmbeddedOgreContext(OgreBites.ApplicationContext if OgreBites else object
         Falls back to a solid grey material if no texture is found.
         """
         mm = Ogre.MaterialManager.getSingleton()
+        sub_count = entity.getNumSubEntities()
+        textured = 0
+        reloaded = set()
 
-        for i in range(entity.getNumSubEntities()):
+        for i in range(sub_count):
             sub = entity.getSubEntity(i)
             mat_name = sub.getMaterialName()  # e.g. "avtank00"
 
-            # Unique preview material name to avoid global conflicts
-            preview_mat_name = f"__preview__{mat_name}"
-
-            # Reuse if already created this session
+            # Find diffuse texture: try several common BZ Redux suffixes
+            # Also try stripping trailing numbers (e.g. avtank00 -> avtank)
+            mat_lower = mat_name.lower()
+            base_variants = (mat_lower, mat_lower.rstrip('0123456789'))
+            candidates = dict.fromkeys(bv + s for bv in base_variants if bv
+                                       for s in self._TEX_SUFFIXES)
+            diffuse_tex = self._find_texture_any(candidates, locations)
+            if diffuse_tex:
+                textured += 1
+            if DEBUG_PREVIEW:
+                print(f"[OgrePreview] {mat_name} -> {diffuse_tex or 'no texture found (grey)'}")
+
+            # Preview materials differ only by texture, so name them after it:
+            # every sub-entity (and later mesh) sharing a texture reuses one
+            # material and RTShader generates its technique only once.
+            preview_mat_name = f"__preview__{diffuse_tex or 'grey'}"
             if mm.resourceExists(preview_mat_name):
                 sub.setMaterialName(preview_mat_name)
+                if diffuse_tex and diffuse_tex not in reloaded:
+                    # The material outlives the mesh; re-read its texture so
+                    # edits made on disk since the last preview show up
+                    reloaded.add(diffuse_tex)
+                    self._reload_texture(diffuse_tex)
                 continue
 
-            # Find diffuse texture: try several common BZ Redux suffixes
-            # Also try stripping trailing numbers (e.g. avtank00 -> avtank)
-            base_variants = [mat_name, mat_name.rstrip('0123456789')]
-            suffixes = ["_a", "_A", "_d", "_D", "_diff", "_DIFF", ""]
-            
-            diffuse_tex = None
-            for bv in base_variants:
-                if not bv: continue
-                for s in suffixes:
-                    diffuse_tex = self._find_texture(bv + s, locations)
-                    if diffuse_tex:
-                        break
-                if diffuse_tex:
-                    break
-
             # Create material
             mat = mm.create(preview_mat_name, self._rg)
             mat.setReceiveShadows(True)
@@ -477,11 +581,9 @@ class _EmbeddedOgreContext(OgreBites.ApplicationContext if OgreBites else object
                     Ogre.TextureUnitState.TAM_WRAP,
                     Ogre.TextureUnitState.TAM_WRAP,
                 )
-                print(f"[OgrePreview] {mat_name} -> {diffuse_tex}")
             else:
                 # Solid grey fallback
                 pass_.setDiffuse(Ogre.ColourValue(0.6, 0.6, 0.65, 1.0))
-                print(f"[OgrePreview] {mat_name} -> no texture found (grey)")
 
             mat.compile()
             
@@ -497,7 +599,16 @@ class _EmbeddedOgreContext(OgreBites.ApplicationContext if OgreBites else object
 
             sub.setMaterialName(preview_mat_name)
 
+        print(f"[OgrePreview] Textures matched for {textured}/{sub_count} sub-entities")
+
 
+    def _reload_texture(self, tex_name: str):
+        try:
+            tex = Ogre.TextureManager.getSingleton().getByName(tex_name, self._rg)
+            if tex and tex.isLoaded():
+                tex.reload()
+        except Exception as e:
+            log_msg(f"[OgrePreview] Could not reload texture {tex_name}: {e}")
 
     def _clear_mesh(self):
         if self._mesh_node and self._scn_mgr:
@@ -509,7 +620,12 @@ class _EmbeddedOgreContext(OgreBites.ApplicationContext if OgreBites else object
             self._mesh_node = None
         if self._mesh_entity and self._scn_mgr:
             try:
+                mesh_name = self._mesh_entity.getMesh().getName()
                 self._scn_mgr.destroyEntity(self._mesh_entity)
+                # The group is no longer cleared on every load; drop the mesh
+                # so previewing it again reads the (possibly rewritten) file.
+                # Reused preview materials reload their textures instead.
+                Ogre.MeshManager.getSingleton().remove(mesh_name, self._rg)
             except Exception:
                 pass
             self._mesh_entity = None
@@ -521,12 +637,23 @@ class _EmbeddedOgreContext(OgreBites.ApplicationContext if OgreBites else object
                 self._render_window.windowMovedOrResized()
             except Exception:
                 pass
+            self._needs_redraw = True
 
-    def render_frame(self):
-        root = Ogre.Root.getSingleton()
-        root.renderOneFrame()
-        if self._render_window:
-            self._render_window.update()
+    def mark_dirty(self):
+        self._needs_redraw = True
+
+    def render_frame(self) -> bool:
+        """Render if the view changed since the last frame; returns whether it did."""
+        win = self._render_window
+        if win is None or not self._needs_redraw:
+            return False
+        # Minimised or collapsed: the swap chain would just drop the frame
+        if win.isHidden() or win.getWidth() == 0 or win.getHeight() == 0:
+            return False
+        self._needs_redraw = False
+        Ogre.Root.getSingleton().renderOneFrame()
+        win.update()
+        return True
 
 
 # ---------------------------------------------------------------------------
@@ -536,19 +663,56 @@ class _EmbeddedOgreContext(OgreBites.ApplicationContext if OgreBites else object
 class OgrePreviewFrame(ctk.CTkFrame):
     """Embeds an Ogre 3D viewport. Supports LMB-orbit, RMB-zoom, MMB-pan."""
 
+    # Distance factors for 1..8 wheel notches in one event (Windows: 120 per notch)
+    _ZOOM_IN  = tuple(0.9 ** n for n in range(1, 9))
+    _ZOOM_OUT = tuple(1.1 ** n for n in range(1, 9))
+
     def __init__(self, parent, **kwargs):
         super().__init__(parent, **kwargs)
 
         self._ctx: "_EmbeddedOgreContext | None" = None
         self._render_job = None
+        # Startup runs in after() steps; see _start_context()
+        self._starting = False
+        self._pending_mesh = None
+        self._init_job = None  # next startup step, cancelled by destroy()
+        self._init_ctx = None  # context between initApp() and its first mesh
+
+        # Frame pacing: the after() delay is the frame period minus a smoothed
+        # render time, so slow frames don't stack on top of a fixed 16 ms wait
+        self._target_fps = 60
+        self._frame_ms_avg = 0.0
+
+        # Render on demand: full rate for a short burst after the view changes,
+        # then the loop stops until _wake_render_loop() restarts it
+        self._active_until = 0.0
+        self._render_idle = True
+
+        # <Configure> fires continuously during a window drag; only the last
+        # size is applied, since each resize rebuilds the swap chain
+        self._resize_job = None
+        self._pending_size = None
+        self._applied_size = None  # last size passed to the render window
 
         # Camera orbit state
         self._orbit_yaw   = 30.0   # degrees
         self._orbit_pitch = 25.0   # degrees
         self._orbit_dist  = 200.0
-        self._orbit_target = [0.0, 0.0, 0.0]  # look-at point
+        self._orbit_target = (0.0, 0.0, 0.0)  # look-at point
         self._mouse_prev  = None
         self._drag_mode   = None   # 'orbit' | 'zoom' | 'pan'
+        # Motion deltas collected until the event queue drains; see _drag_move()
+        self._pending_dx  = 0
+        self._pending_dy  = 0
+        self._drag_job    = None
+        # Orbit basis vectors, keyed on (yaw, pitch); zoom and pan reuse them
+        self._basis_key   = None
+        self._basis       = None
+        self._trig        = [(None, 0.0, 1.0), (None, 0.0, 1.0)]  # (deg, sin, cos) for yaw, pitch
+        self._target_key  = None
+        self._target_vec  = None
+        self._applied_pose = None  # last pose sent to the camera node
+        self._camera_dirty = False  # orbit changed since the last frame
 
         if not Ogre:
             lbl = ctk.CTkLabel(
@@ -581,35 +745,45 @@ class OgrePreviewFrame(ctk.CTkFrame):
             font=("Consolas", 8),
         )
 
-        self._render_frame.bind("<Configure>", self._on_resize)
+        # Error message, placed by _show_error() and reused for every error
+        self._error_label = tk.Label(
+            self._render_frame,
+            fg="#ff4444",
+            bg="black",
+            font=("Consolas", 10),
+            wraplength=300,
+            justify="center",
+        )
 
-        # Mouse bindings
-        self._render_frame.bind("<ButtonPress-1>",   lambda e: self._drag_start(e, "orbit"))
-        self._render_frame.bind("<ButtonPress-3>",   lambda e: self._drag_start(e, "zoom"))
-        self._render_frame.bind("<ButtonPress-2>",   lambda e: self._drag_start(e, "pan"))
-        self._render_frame.bind("<B1-Motion>",       self._drag_move)
-        self._render_frame.bind("<B3-Motion>",       self._drag_move)
-        self._render_frame.bind("<B2-Motion>",       self._drag_move)
-        self._render_frame.bind("<ButtonRelease-1>", self._drag_end)
-        self._render_frame.bind("<ButtonRelease-3>", self._drag_end)
-        self._render_frame.bind("<ButtonRelease-2>", self._drag_end)
-        self._render_frame.bind("<MouseWheel>",      self._mouse_wheel)
+        self._render_frame.bind("<Configure>", self._on_resize)
+        # Uncovered after being obscured: the last frame has to be presented again
+        self._render_frame.bind("<Expose>", lambda e: self._request_render())
+        # Mouse bindings are added by _bind_mouse() once a context exists
 
     # ------------------------------------------------------------------
     # Public API
     # ------------------------------------------------------------------
 
     def load_mesh(self, mesh_path: str):
+        # One Ogre context serves every preview for the lifetime of this
+        # frame: later loads only swap the entity. closeApp() runs solely in
+        # destroy(), since an embedded render window can't be moved to a
+        # new HWND and rebuilt contexts pay the full device/RTShader setup.
         if not Ogre:
             return
 
-        if self._ctx is None:
+        if self._starting:
+            # Still initialising: load the most recent request once ready
+            self._pending_mesh = mesh_path
+        elif self._ctx is None:
             self._start_context(mesh_path)
         else:
             try:
                 diam = self._ctx.load_mesh(mesh_path)
                 self._reset_camera(diam)
                 self._apply_camera()
+                self._error_label.place_forget()
+                self._hint.place(relx=0.5, rely=1.0, anchor="s", y=-4)
             except Exception as e:
                 import traceback; traceback.print_exc()
                 self._show_error(str(e))
@@ -619,16 +793,30 @@ class OgrePreviewFrame(ctk.CTkFrame):
     # ------------------------------------------------------------------
 
     def _start_context(self, mesh_path: str):
+        """
+        Bring Ogre up in steps scheduled with after(), so Tk can paint the
+        "starting" message and handle events between initApp() and the first
+        mesh load. Ogre stays on the Tk thread: the render window embeds a
+        Tk-owned HWND and the GL render systems bind their context to the
+        thread that created it.
+        """
         # Clear log for new session
         log_msg(f"[_start_context] Called for {mesh_path}")
-        try:
-            with open(LOG_FILE, "w") as f:
-                f.write("--- NEW PREVIEW SESSION ---\n")
-                f.flush()
-        except: pass
+        reset_log("--- NEW PREVIEW SESSION ---")
         
         log_msg("[OgrePreview] Starting Ogre context...")
-        self.update() # Ensure window is mapped
+        self._starting = True
+        self._pending_mesh = mesh_path
+        self._error_label.place_forget()
+        self._placeholder.configure(text="Starting Ogre preview...")
+        self._placeholder.place(relx=0.5, rely=0.5, anchor="center")
+        self.update() # Ensure window is mapped and the message painted
+        self._init_job = self.after(0, self._init_context)
+
+    def _init_context(self):
+        self._init_job = None
+        if not self._starting:
+            return  # destroyed meanwhile
         hwnd = self._render_frame.winfo_id()
         w = max(200, self._render_frame.winfo_width())
         h = max(150, self._render_frame.winfo_height())
@@ -639,42 +827,107 @@ class OgrePreviewFrame(ctk.CTkFrame):
             log_msg("[OgrePreview] Calling initApp()...")
             ctx.initApp()
             log_msg("[OgrePreview] initApp() completed.")
-            diam = ctx.load_mesh(mesh_path)
+        except Exception as e:
+            self._abort_context(ctx, e)
+            return
+        # Back to the event loop before parsing the mesh
+        self._init_ctx = ctx
+        self._init_job = self.after(0, self._finish_context, ctx)
+
+    def _finish_context(self, ctx):
+        self._init_job = None
+        self._init_ctx = None
+        if not self._starting:
+            self._abort_context(ctx, None)
+            return
+        try:
+            diam = ctx.load_mesh(self._pending_mesh)
             log_msg(f"[OgrePreview] load_mesh() completed. Diam: {diam}")
         except Exception as e:
-            import traceback
-            err_details = traceback.format_exc()
-            log_msg(f"[OgrePreview] CRITICAL ERROR DURING INIT:\n{err_details}")
-            try:
-                ctx.closeApp()
-            except Exception:
-                pass
-            self._show_error(str(e))
+            self._abort_context(ctx, e)
             return
 
+        self._starting = False
+        self._pending_mesh = None
         self._ctx = ctx
+        self._applied_size = None
+        self._bind_mouse()
         self._reset_camera(diam)
         self._apply_camera()
 
         self._placeholder.place_forget()
         self._hint.place(relx=0.5, rely=1.0, anchor="s", y=-4)
 
-        self._render_job = self.after(16, self._render_loop)
+        self._request_render()
+
+    def _abort_context(self, ctx, error):
+        was_starting = self._starting
+        self._starting = False
+        self._pending_mesh = None
+        if error is not None:
+            import traceback
+            err_details = traceback.format_exc()
+            log_msg(f"[OgrePreview] CRITICAL ERROR DURING INIT:\n{err_details}")
+        try:
+            ctx.closeApp()
+        except Exception:
+            pass
+        if error is not None and was_starting:
+            self._show_error(str(error))
 
     # ------------------------------------------------------------------
     # Render loop
     # ------------------------------------------------------------------
 
+    def set_target_fps(self, fps: float):
+        self._target_fps = max(1.0, float(fps))
+
+    def _request_render(self):
+        """Mark the view as changed; restarts the loop if it has gone idle."""
+        if self._ctx:
+            self._ctx.mark_dirty()
+        self._active_until = time.perf_counter() + 0.5
+        self._wake_render_loop()
+
+    def _request_camera(self):
+        """Orbit state changed; the pose is pushed to Ogre once, before the next frame."""
+        self._camera_dirty = True
+        self._wake_render_loop()
+
+    def _wake_render_loop(self):
+        if self._ctx and self._render_idle:
+            self._stop_render()
+            self._render_idle = False
+            self._render_job = self.after(0, self._render_loop)
+
     def _render_loop(self):
+        self._render_job = None
         if not self._ctx:
             return
-        try:
-            self._ctx.render_frame()
-        except Exception as e:
-            print(f"[OgrePreview] Render error: {e}")
-            self._stop_render()
+        if self._camera_dirty:
+            self._camera_dirty = False
+            self._apply_camera()
+        t0 = time.perf_counter()
+        active = t0 < self._active_until
+        # Nothing to draw into while hidden behind another tab or minimised
+        if self.winfo_viewable():
+            try:
+                drawn = self._ctx.render_frame()
+            except Exception as e:
+                print(f"[OgrePreview] Render error: {e}")
+                self._stop_render()
+                return
+            if drawn:
+                frame_ms = (time.perf_counter() - t0) * 1000.0
+                self._frame_ms_avg += 0.1 * (frame_ms - self._frame_ms_avg)
+
+        if not active:
+            # Every change goes through _request_render()/_request_camera(),
+            # and <Expose> covers repaints, so nothing is left to poll for
+            self._render_idle = True
             return
-        self._render_job = self.after(16, self._render_loop)
+        delay = max(1, int(round(1000.0 / self._target_fps - self._frame_ms_avg)))
+        self._render_job = self.after(delay, self._render_loop)
 
     def _stop_render(self):
         if self._render_job is not None:
@@ -692,49 +945,121 @@ class OgrePreviewFrame(ctk.CTkFrame):
         self._orbit_dist   = diam * 1.8
         self._orbit_yaw    = 30.0
         self._orbit_pitch  = 20.0
-        self._orbit_target = [0.0, 0.0, 0.0]
+        self._orbit_target = (0.0, 0.0, 0.0)
+        self._applied_pose = None
+
+    def _orbit_basis(self):
+        """(eye direction, right, up) unit vectors, recomputed only when the angles change."""
+        key = (self._orbit_yaw, self._orbit_pitch)
+        if key != self._basis_key:
+            # Horizontal orbits leave pitch alone (and pitch is pinned while
+            # dragging against its clamp), so each angle's sin/cos is kept apart
+            sin_yaw, cos_yaw     = self._sincos(self._orbit_yaw, 0)
+            sin_pitch, cos_pitch = self._sincos(self._orbit_pitch, 1)
+            self._basis = (
+                (cos_pitch * sin_yaw, sin_pitch, cos_pitch * cos_yaw),
+                # Camera right vector
+                (cos_yaw, 0.0, -sin_yaw),
+                # Camera up vector (approximate world-up projected onto view plane)
+                (-sin_pitch * sin_yaw, cos_pitch, -sin_pitch * cos_yaw),
+            )
+            self._basis_key = key
+        return self._basis
+
+    def _sincos(self, degrees: float, slot: int):
+        cached = self._trig[slot]
+        if cached[0] != degrees:
+            r = degrees * _DEG_TO_RAD
+            cached = self._trig[slot] = (degrees, math.sin(r), math.cos(r))
+        return cached[1], cached[2]
 
     def _apply_camera(self):
         if not self._ctx or not self._ctx._camnode:
             return
-        yaw_r   = math.radians(self._orbit_yaw)
-        pitch_r = math.radians(self._orbit_pitch)
+        # Dragging against the pitch clamp or zoom floor leaves the pose as is;
+        # skip the Ogre calls and the redraw then
+        pose = (self._orbit_yaw, self._orbit_pitch, self._orbit_dist, self._orbit_target)
+        if pose == self._applied_pose:
+            return
+        self._applied_pose = pose
+        (ex, ey, ez), _, _ = self._orbit_basis()
         d = self._orbit_dist
 
-        x = d * math.cos(pitch_r) * math.sin(yaw_r)
-        y = d * math.sin(pitch_r)
-        z = d * math.cos(pitch_r) * math.cos(yaw_r)
+        x = d * ex
+        y = d * ey
+        z = d * ez
 
-        tx, ty, tz = self._orbit_target
-        pos = Ogre.Vector3(tx + x, ty + y, tz + z)
-        target = Ogre.Vector3(tx, ty, tz)
+        tx, ty, tz = target = self._orbit_target
+        # Only pan moves the target, so its Vector3 is rebuilt only then;
+        # the position goes through SceneNode's (x, y, z) overload
+        if target != self._target_key:
+            self._target_vec = Ogre.Vector3(tx, ty, tz)
+            self._target_key = target
 
-        self._ctx._camnode.setPosition(pos)
-        self._ctx._camnode.lookAt(target, Ogre.Node.TS_WORLD)
+        self._ctx._camnode.setPosition(tx + x, ty + y, tz + z)
+        self._ctx._camnode.lookAt(self._target_vec, Ogre.Node.TS_WORLD)
 
         # Keep near/far sensible as distance changes
         if self._ctx._cam:
             self._ctx._cam.setNearClipDistance(max(0.01, d * 0.001))
 
+        self._request_render()
+
     # ------------------------------------------------------------------
     # Mouse controls
     # ------------------------------------------------------------------
 
+    def _bind_mouse(self):
+        # Bound only once _ctx is set (it is cleared again only by destroy()),
+        # so the per-event handlers need no context check
+        frame = self._render_frame
+        frame.bind("<ButtonPress-1>",   lambda e: self._drag_start(e, "orbit"))
+        frame.bind("<ButtonPress-3>",   lambda e: self._drag_start(e, "zoom"))
+        frame.bind("<ButtonPress-2>",   lambda e: self._drag_start(e, "pan"))
+        frame.bind("<B1-Motion>",       self._drag_move)
+        frame.bind("<B3-Motion>",       self._drag_move)
+        frame.bind("<B2-Motion>",       self._drag_move)
+        frame.bind("<ButtonRelease-1>", self._drag_end)
+        frame.bind("<ButtonRelease-3>", self._drag_end)
+        frame.bind("<ButtonRelease-2>", self._drag_end)
+        frame.bind("<MouseWheel>",      self._mouse_wheel)
+
     def _drag_start(self, event, mode: str):
+        # A second button pressed mid-drag switches modes; motion collected
+        # under the old mode must not be applied under the new one
+        if self._drag_job is not None:
+            self.after_cancel(self._drag_job)
+            self._flush_drag()
         self._mouse_prev = (event.x, event.y)
         self._drag_mode  = mode
         self._render_frame.focus_set()
 
     def _drag_end(self, event):
+        if self._drag_job is not None:
+            self.after_cancel(self._drag_job)
+            self._flush_drag()
         self._mouse_prev = None
         self._drag_mode  = None
 
     def _drag_move(self, event):
-        if self._mouse_prev is None or not self._ctx:
+        # High-rate mice deliver far more <Motion> events than frames; sum the
+        # deltas and apply them once when Tk goes idle
+        prev = self._mouse_prev
+        if prev is None:
+            return
+        x, y = event.x, event.y
+        self._pending_dx += x - prev[0]
+        self._pending_dy += y - prev[1]
+        self._mouse_prev = (x, y)
+        if self._drag_job is None:
+            self._drag_job = self.after_idle(self._flush_drag)
+
+    def _flush_drag(self):
+        self._drag_job = None
+        dx, dy = self._pending_dx, self._pending_dy
+        self._pending_dx = self._pending_dy = 0
+        if not self._ctx or (dx == 0 and dy == 0):
             return
-        dx = event.x - self._mouse_prev[0]
-        dy = event.y - self._mouse_prev[1]
-        self._mouse_prev = (event.x, event.y)
 
         if self._drag_mode == "orbit":
             self._orbit_yaw   -= dx * 0.5
@@ -748,33 +1073,26 @@ class OgrePreviewFrame(ctk.CTkFrame):
 
         elif self._drag_mode == "pan":
             # Pan in camera's local XY plane
-            yaw_r   = math.radians(self._orbit_yaw)
-            pitch_r = math.radians(self._orbit_pitch)
-            scale   = self._orbit_dist * 0.002
-
-            # Camera right vector
-            right_x =  math.cos(yaw_r)
-            right_z = -math.sin(yaw_r)
-            # Camera up vector (approximate world-up projected onto view plane)
-            up_x = -math.sin(pitch_r) * math.sin(yaw_r)
-            up_y =  math.cos(pitch_r)
-            up_z = -math.sin(pitch_r) * math.cos(yaw_r)
-
-            self._orbit_target[0] -= (dx * right_x - dy * up_x) * scale
-            self._orbit_target[1] -= dy * up_y * scale
-            self._orbit_target[2] -= (dx * right_z - dy * up_z) * scale
+            _, (right_x, _, right_z), (up_x, up_y, up_z) = self._orbit_basis()
+            scale = self._orbit_dist * 0.002
 
-        self._apply_camera()
+            sx, sy = dx * scale, dy * scale
+            tx, ty, tz = self._orbit_target
+            self._orbit_target = (tx - sx * right_x + sy * up_x,
+                                  ty - sy * up_y,
+                                  tz - sx * right_z + sy * up_z)
+
+        self._request_camera()
 
     def _mouse_wheel(self, event):
-        if not self._ctx:
+        if not event.delta:
             return
-        if event.delta > 0:
-            self._orbit_dist *= 0.9
-        else:
-            self._orbit_dist *= 1.1
-        self._orbit_dist = max(0.01, self._orbit_dist)
-        self._apply_camera()
+        # Fast wheels fold several notches into one event; macOS reports
+        # small deltas, which still count as one notch
+        notches = min(max(1, abs(event.delta) // 120), len(self._ZOOM_IN))
+        table = self._ZOOM_IN if event.delta > 0 else self._ZOOM_OUT
+        self._orbit_dist = max(0.01, self._orbit_dist * table[notches - 1])
+        self._request_camera()
 
     # ------------------------------------------------------------------
     # Resize / error display
@@ -782,29 +1100,59 @@ class OgrePreviewFrame(ctk.CTkFrame):
 
     def _on_resize(self, event):
         if self._ctx and event.widget == self._render_frame:
-            w, h = event.width, event.height
-            if w > 10 and h > 10:
-                self._ctx.resize(w, h)
+            self._pending_size = (event.width, event.height)
+            if self._resize_job is not None:
+                self.after_cancel(self._resize_job)
+            self._resize_job = self.after(80, self._do_resize)
+
+    def _do_resize(self):
+        self._resize_job = None
+        if not self._ctx or self._pending_size is None:
+            return
+        w, h = size = self._pending_size
+        self._pending_size = None
+        # <Configure> also fires when the frame is only moved or re-laid out;
+        # resizing the window to its current size would still rebuild it
+        if w > 10 and h > 10 and size != self._applied_size:
+            self._applied_size = size
+            self._ctx.resize(w, h)
+            self._request_render()
 
     def _show_error(self, message: str):
-        for child in self._render_frame.winfo_children():
+        self._placeholder.place_forget()
+        self._hint.place_forget()
+        self._error_label.configure(text=f"Preview error:\n{message}")
+        self._error_label.place(relx=0.5, rely=0.5, anchor="center")
+
+    def destroy(self):
+        self._starting = False
+        # A startup step still queued would fire on a deleted Tcl command and
+        # leave its initApp()'d context open
+        if self._init_job is not None:
             try:
-                child.destroy()
+                self.after_cancel(self._init_job)
             except Exception:
                 pass
-        lbl = tk.Label(
-            self._render_frame,
-            text=f"Preview error:\n{message}",
-            fg="#ff4444",
-            bg="black",
-            font=("Consolas", 10),
-            wraplength=300,
-            justify="center",
-        )
-        lbl.place(relx=0.5, rely=0.5, anchor="center")
-
-    def destroy(self):
+            self._init_job = None
+        if self._init_ctx is not None:
+            try:
+                self._init_ctx.closeApp()
+            except Exception:
+                pass
+            self._init_ctx = None
         self._stop_render()
+        if self._drag_job is not None:
+            try:
+                self.after_cancel(self._drag_job)
+            except Exception:
+                pass
+            self._drag_job = None
+        if self._resize_job is not None:
+            try:
+                self.after_cancel(self._resize_job)
+            except Exception:
+                pass
+            self._resize_job = None
         if self._ctx:
             try:
                 self._ctx.closeApp()
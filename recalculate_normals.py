@@ -6,6 +6,7 @@ Recalculates vertex normals from face data in Ogre .mesh.xml files
 
 import xml.etree.ElementTree as ET
 import math
+import struct
 import sys
 import os
 from collections import defaultdict
@@ -48,6 +49,257 @@ def calculate_face_normal(v1, v2, v3):
     normal = edge1.cross(edge2)
     return normal.normalize()
 
+# Binary .mesh chunk ids and enum values (OgreMeshFileFormat.h / OgreVertexElement.h)
+M_HEADER = 0x1000
+M_MESH = 0x3000
+M_SUBMESH = 0x4000
+M_SUBMESH_OPERATION = 0x4010
+M_SUBMESH_BONE_ASSIGNMENT = 0x4100
+M_SUBMESH_TEXTURE_ALIAS = 0x4200
+M_GEOMETRY = 0x5000
+M_GEOMETRY_VERTEX_DECLARATION = 0x5100
+M_GEOMETRY_VERTEX_ELEMENT = 0x5110
+M_GEOMETRY_VERTEX_BUFFER = 0x5200
+M_GEOMETRY_VERTEX_BUFFER_DATA = 0x5210
+CHUNK_HEADER_SIZE = 6  # uint16 id + uint32 length
+VES_POSITION = 1
+VES_NORMAL = 4
+VET_FLOAT3 = 2
+OT_TRIANGLE_LIST = 4
+
+_FLOAT3 = struct.Struct('<3f')
+
+
+class _MeshReader:
+    """Little-endian cursor over the bytes of a binary .mesh file"""
+    
+    def __init__(self, data):
+        self.data = data
+        self.pos = 0
+    
+    def at_end(self):
+        return self.pos >= len(self.data)
+    
+    def unpack(self, fmt):
+        values = struct.unpack_from('<' + fmt, self.data, self.pos)
+        self.pos += struct.calcsize('<' + fmt)
+        return values
+    
+    def u16(self):
+        return self.unpack('H')[0]
+    
+    def u32(self):
+        return self.unpack('I')[0]
+    
+    def boolean(self):
+        return self.unpack('?')[0]
+    
+    def string(self):
+        end = self.data.index(b'\n', self.pos)
+        value = self.data[self.pos:end].decode('latin-1')
+        self.pos = end + 1
+        return value
+    
+    def take(self, size):
+        if self.pos + size > len(self.data):
+            raise ValueError("Unexpected end of mesh data")
+        value = self.data[self.pos:self.pos + size]
+        self.pos += size
+        return value
+    
+    def chunk(self):
+        return self.unpack('HI')
+    
+    def backpedal(self):
+        self.pos -= CHUNK_HEADER_SIZE
+
+
+def _read_geometry(reader):
+    """Read an M_GEOMETRY body, returning (positions, normals) or None if unsupported.
+    
+    Mirrors what recalculate_normals() sees in the XML: only the lowest-index
+    vertex buffer is looked at. normals is None when that buffer has none.
+    """
+    vertex_count = reader.u32()
+    elements = []
+    buffers = {}
+    
+    while not reader.at_end():
+        chunk_id, _ = reader.chunk()
+        if chunk_id == M_GEOMETRY_VERTEX_DECLARATION:
+            while not reader.at_end():
+                chunk_id, _ = reader.chunk()
+                if chunk_id != M_GEOMETRY_VERTEX_ELEMENT:
+                    reader.backpedal()
+                    break
+                # source, type, semantic, offset, index
+                elements.append(reader.unpack('5H'))
+        elif chunk_id == M_GEOMETRY_VERTEX_BUFFER:
+            bind_index, vertex_size = reader.unpack('2H')
+            chunk_id, _ = reader.chunk()
+            if chunk_id != M_GEOMETRY_VERTEX_BUFFER_DATA:
+                return None
+            buffers[bind_index] = (vertex_size, reader.take(vertex_count * vertex_size))
+        else:
+            reader.backpedal()
+            break
+    
+    if not buffers:
+        return None
+    
+    # OgreXMLConverter writes one <vertexbuffer> per binding, in index order
+    source = min(buffers)
+    vertex_size, data = buffers[source]
+    source_elements = {semantic: (vtype, offset) for src, vtype, semantic, offset, _ in elements
+                       if src == source}
+    
+    if VES_NORMAL not in source_elements:
+        return [], None
+    if VES_POSITION not in source_elements:
+        return None
+    
+    def read_float3(semantic):
+        vtype, offset = source_elements[semantic]
+        if vtype != VET_FLOAT3 or offset + _FLOAT3.size > vertex_size:
+            raise ValueError("Unsupported vertex element layout")
+        return [_FLOAT3.unpack_from(data, i * vertex_size + offset) for i in range(vertex_count)]
+    
+    return read_float3(VES_POSITION), read_float3(VES_NORMAL)
+
+
+def _read_submesh(reader):
+    """Read an M_SUBMESH body, returning (indices, positions, normals) or None if unsupported"""
+    reader.string()  # material name
+    if reader.boolean():
+        # Shared vertices are rewritten submesh by submesh in the XML path,
+        # which this reader doesn't try to reproduce
+        return None
+    index_count = reader.u32()
+    indexes_32bit = reader.boolean()
+    indices = reader.unpack(('I' if indexes_32bit else 'H') * index_count) if index_count else ()
+    
+    chunk_id, _ = reader.chunk()
+    if chunk_id != M_GEOMETRY:
+        return None
+    geometry = _read_geometry(reader)
+    if geometry is None:
+        return None
+    
+    operation = OT_TRIANGLE_LIST
+    while not reader.at_end():
+        chunk_id, length = reader.chunk()
+        if chunk_id == M_SUBMESH_OPERATION:
+            operation = reader.u16()
+        elif chunk_id in (M_SUBMESH_BONE_ASSIGNMENT, M_SUBMESH_TEXTURE_ALIAS):
+            reader.take(length - CHUNK_HEADER_SIZE)
+        else:
+            reader.backpedal()
+            break
+    
+    if operation != OT_TRIANGLE_LIST or index_count == 0 or index_count % 3:
+        return None
+    positions, normals = geometry
+    return indices, positions, normals
+
+
+def _read_binary_submeshes(data):
+    """Parse the submeshes of a binary .mesh, or return None if any are unsupported"""
+    reader = _MeshReader(data)
+    if reader.u16() != M_HEADER:
+        return None  # not a mesh, or big-endian
+    reader.string()  # e.g. "[MeshSerializer_v1.100]"
+    chunk_id, _ = reader.chunk()
+    if chunk_id != M_MESH:
+        return None
+    reader.boolean()  # skeletally animated
+    
+    submeshes = []
+    while not reader.at_end():
+        chunk_id, length = reader.chunk()
+        if chunk_id == M_SUBMESH:
+            submesh = _read_submesh(reader)
+            if submesh is None:
+                return None
+            submeshes.append(submesh)
+        elif submeshes:
+            break  # skeleton links, LODs, bounds etc. don't affect normals
+        else:
+            reader.take(length - CHUNK_HEADER_SIZE)  # shared geometry
+    return submeshes
+
+
+def _xml_float(value):
+    """Round a float the way OgreXMLConverter writes it (6 significant digits)"""
+    return float(f"{value:.6g}")
+
+
+def _submesh_normals_change(indices, positions, normals, to_float):
+    """Run the recalculate_normals() comparison on raw arrays; True if any normal would change"""
+    vertex_count = len(positions)
+    points = [Vector3(to_float(x), to_float(y), to_float(z)) for x, y, z in positions]
+    vertex_normals = [Vector3(0, 0, 0) for _ in range(vertex_count)]
+    vertex_face_count = [0] * vertex_count
+    
+    for f in range(0, len(indices), 3):
+        v1_idx, v2_idx, v3_idx = indices[f], indices[f + 1], indices[f + 2]
+        if v1_idx < vertex_count and v2_idx < vertex_count and v3_idx < vertex_count:
+            face_normal = calculate_face_normal(points[v1_idx], points[v2_idx], points[v3_idx])
+            vertex_normals[v1_idx] = vertex_normals[v1_idx] + face_normal
+            vertex_normals[v2_idx] = vertex_normals[v2_idx] + face_normal
+            vertex_normals[v3_idx] = vertex_normals[v3_idx] + face_normal
+            vertex_face_count[v1_idx] += 1
+            vertex_face_count[v2_idx] += 1
+            vertex_face_count[v3_idx] += 1
+    
+    for i in range(vertex_count):
+        old_x, old_y, old_z = (to_float(c) for c in normals[i])
+        if vertex_face_count[i] > 0:
+            final_normal = (vertex_normals[i] * (1.0 / vertex_face_count[i])).normalize()
+            if (abs(old_x - final_normal.x) > 0.0001 or 
+                abs(old_y - final_normal.y) > 0.0001 or 
+                abs(old_z - final_normal.z) > 0.0001):
+                return True
+        elif abs(old_y - 1.0) > 0.0001:
+            return True
+    return False
+
+
+def check_binary_mesh_normals(mesh_path):
+    """Predict recalculate_normals() for a binary .mesh without converting it to XML.
+    
+    Returns "UNCHANGED", "CHANGED", or None when the mesh uses a layout this
+    reader doesn't handle (shared vertices, non-triangle-list submeshes,
+    non-float3 positions/normals, big-endian files) or the outcome depends on
+    the converter's float precision. Callers fall back to the XML round-trip
+    on None.
+    
+    "UNCHANGED" costs two face-accumulation passes, one per precision the
+    converter may write. "CHANGED" comes from the 6-digit pass alone: callers
+    run the XML round-trip for it anyway, and that decides what is written.
+    """
+    try:
+        with open(mesh_path, 'rb') as f:
+            submeshes = _read_binary_submeshes(f.read())
+    except (OSError, ValueError, struct.error):
+        return None
+    if not submeshes:
+        return None
+    
+    def changes(to_float):
+        return any(
+            _submesh_normals_change(indices, positions, normals, to_float)
+            for indices, positions, normals in submeshes
+            if normals is not None
+        )
+    
+    if changes(_xml_float):
+        return "CHANGED"
+    # The XML either carries 6 significant digits or the exact float value
+    # depending on the converter build; "UNCHANGED" must hold for both.
+    if changes(float):
+        return None
+    return "UNCHANGED"
+
 def recalculate_normals(xml_file_path):
     """Recalculate normals for an Ogre mesh XML file"""
     
@@ -6,14 +6,30 @@
 import os
 import sys
 
-_meipass = getattr(sys, "_MEIPASS", None)
+# PyInstaller sets sys.frozen and sys._MEIPASS together; a hook imported
+# from source (e.g. by tooling) leaves the environment alone
+_meipass = sys._MEIPASS if getattr(sys, "frozen", False) else None
 if _meipass:
     # Add extraction dir and Ogre subdir to PATH so Windows finds Ogre DLLs
     ogre_dir = os.path.join(_meipass, "Ogre")
     
+    # Python 3.8+ resolves extension module (ogre-python's .pyd) dependencies
+    # from these directories only, not from PATH
+    if sys.platform == "win32" and sys.version_info >= (3, 8):
+        for dll_dir in (_meipass, ogre_dir):
+            if os.path.isdir(dll_dir):
+                os.add_dll_directory(dll_dir)
+
+    # PATH is still needed: Ogre loads render-system plugins with plain
+    # LoadLibrary, which ignores add_dll_directory(), and the bundled
+    # converters run as child processes. These inherit PATH, so a hook run
+    # again in a child must not prepend twice.
     current_path = os.environ.get("PATH", "")
-    new_path = f"{_meipass};{ogre_dir};{current_path}"
-    os.environ["PATH"] = new_path
+    if _meipass not in current_path.split(os.pathsep):
+        parts = [_meipass, ogre_dir]
+        if current_path:
+            parts.append(current_path)
+        os.environ["PATH"] = os.pathsep.join(parts)
     
     # We do NOT os.chdir() here as it breaks relative paths for main app resources
 